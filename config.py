@@ -4,15 +4,35 @@ Contains retry config, model settings, and presentation config structure.
 """
 
 import os
-from google.genai import types
+from functools import lru_cache
 
-# Retry configuration for API calls
-RETRY_CONFIG = types.HttpRetryOptions(
-    attempts=1,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
-)
+
+@lru_cache(maxsize=1)
+def get_retry_config():
+    """
+    Retry configuration for API calls.
+    
+    Built on first use so importing config (e.g. for PresentationConfig or
+    plain constants) does not import the google-genai SDK.
+    
+    Returns:
+        types.HttpRetryOptions shared by all model instances
+    """
+    from google.genai import types
+    
+    return types.HttpRetryOptions(
+        attempts=1,  # Maximum retry attempts
+        exp_base=7,  # Delay multiplier
+        initial_delay=1,
+        http_status_codes=[429, 500, 503, 504],  # Retry on these HTTP errors
+    )
+
+
+def __getattr__(name: str):
+    """Keep `from config import RETRY_CONFIG` working (built lazily)."""
+    if name == "RETRY_CONFIG":
+        return get_retry_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # LLM retry configuration for agent execution
 # Number of times to retry LLM calls when they fail due to format issues
@@ -22,6 +42,18 @@ LLM_RETRY_COUNT = 2  # Default: 2 retries (total of 3 attempts: 1 initial + 2 re
 DEFAULT_MODEL = "gemini-2.5-flash-lite"  # For generation agents (fast, cost-effective)
 CRITIC_MODEL = "gemini-2.5-flash"  # For evaluation agents (stronger model for better judgment)
 
+# Gemini context caching for static agent instructions (used when the installed ADK supports it)
+CONTEXT_CACHE_MIN_TOKENS = 1024  # Gemini's minimum cacheable prefix size
+CONTEXT_CACHE_TTL_SECONDS = 1800
+CONTEXT_CACHE_INTERVALS = 10  # Refresh the cache after this many invocations
+
+# Accept outlines whose figures all appear verbatim in the report without calling the critic LLM
+# (opt-in: OUTLINE_FAST_ACCEPT=true; trades critic judgment for one fewer LLM round trip)
+OUTLINE_FAST_ACCEPT = os.getenv("OUTLINE_FAST_ACCEPT", "false").lower() == "true"
+
+# Stream model responses (SSE) instead of waiting for the full response in one HTTP call
+LLM_STREAMING = os.getenv("LLM_STREAMING", "false").lower() == "true"
+
 # ============================================================================
 # Application Configuration
 # ============================================================================
@@ -36,6 +68,25 @@ OUTPUT_DIR = os.getenv("OUTPUT_DIR", "presentation_agent/output")
 OUTPUT_DIR_DEPLOYMENT = os.getenv("OUTPUT_DIR", "/tmp/output")  # For Cloud Run deployment
 OUTPUT_DIR_IMAGES = os.path.join(OUTPUT_DIR, "generated_images")
 
+# Exact-match cache of parsed agent outputs (opt-in: RESPONSE_CACHE=true)
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE", "false").lower() == "true"
+# Agents whose outputs are cached. Only list agents whose output is safe to replay:
+# the outline generator, critic and slide generator sample their outputs and those
+# outputs can be rejected downstream, so caching them could replay a bad result forever
+RESPONSE_CACHE_AGENTS = ("ReportUnderstandingAgent",)
+RESPONSE_CACHE_DIR = os.getenv("RESPONSE_CACHE_DIR", os.path.join(OUTPUT_DIR, "response_cache"))
+
+# Disk cache for downloaded + parsed report PDFs, keyed by URL hash (opt-in: CACHE_PDF=1)
+PDF_CACHE_ENABLED = os.getenv("CACHE_PDF", "false").lower() in ("1", "true")
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", os.path.join(OUTPUT_DIR, ".pdf_cache"))
+PDF_CACHE_TTL_SECONDS = int(os.getenv("PDF_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Save trace history zstd-compressed as trace_history.json.zst (opt-in: COMPRESS_TRACE=true, needs zstandard)
+COMPRESS_TRACE_HISTORY = os.getenv("COMPRESS_TRACE", "false").lower() == "true"
+
+# Debug log records are buffered and written in batches (flushed at once on ERROR)
+LOG_BUFFER_CAPACITY = int(os.getenv("LOG_BUFFER_CAPACITY", "512"))
+
 # Default Logic Values
 DEFAULT_DURATION_SECONDS = 60  # Default to 1 minute if duration cannot be parsed
 DEFAULT_NUM_SLIDES = 8  # Default number of slides if outline doesn't specify
@@ -76,6 +127,18 @@ class PresentationConfig:
         style_images: List of image URLs or paths for style extraction (optional)
         template_file: Path to custom template file (optional)
     """
+    _FIELDS = (
+        "scenario",
+        "duration",
+        "target_audience",
+        "custom_instruction",
+        "report_url",
+        "report_content",
+        "style_images",
+        "template_file",
+    )
+    __slots__ = _FIELDS + ("_dict_cache",)
+    
     def __init__(
         self,
         scenario: str = "",  # Optional - if not provided or empty, LLM will infer from report content
@@ -96,16 +159,22 @@ class PresentationConfig:
         self.style_images = style_images or []
         self.template_file = template_file
     
+    def __setattr__(self, name, value):
+        # Fields such as report_content are filled in late; drop the cached dict on change
+        if name in PresentationConfig._FIELDS:
+            object.__setattr__(self, "_dict_cache", None)
+        object.__setattr__(self, name, value)
+    
     def to_dict(self):
-        """Convert to dictionary for easy state management."""
-        return {
-            "scenario": self.scenario,
-            "duration": self.duration,
-            "target_audience": self.target_audience,
-            "custom_instruction": self.custom_instruction,
-            "report_url": self.report_url,
-            "report_content": self.report_content,
-            "style_images": self.style_images,
-            "template_file": self.template_file,
-        }
+        """
+        Convert to dictionary for easy state management.
+        
+        The dictionary is cached until a field is reassigned, so callers must
+        copy it before mutating.
+        """
+        cached = getattr(self, "_dict_cache", None)
+        if cached is None:
+            cached = {name: getattr(self, name) for name in PresentationConfig._FIELDS}
+            object.__setattr__(self, "_dict_cache", cached)
+        return cached
 
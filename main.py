@@ -11,12 +11,14 @@ Refactored following SOLID principles:
 
 import asyncio
 from config import PresentationConfig, OUTPUT_DIR
-from presentation_agent.core.pipeline_orchestrator import PipelineOrchestrator
-from presentation_agent.core.app_initializer import AppInitializer
 
 
 async def main():
     """Main function for local development."""
+    # Imported here so importing main does not pull in the ADK / genai SDKs
+    from presentation_agent.core.pipeline_orchestrator import PipelineOrchestrator
+    from presentation_agent.core.app_initializer import AppInitializer
+    
     output_dir = OUTPUT_DIR
     
     # Initialize application (logging, environment, API key validation)
@@ -1,12 +1,12 @@
 from google.adk.agents import LlmAgent, SequentialAgent
-from google.adk.models.google_llm import Gemini
 import sys
 import os
 import json
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import RETRY_CONFIG, DEFAULT_MODEL
+from config import DEFAULT_MODEL
+from presentation_agent.utils.model_provider import get_shared_model
 
 # Import sub-agents from agents/ subdirectory (they export 'agent', not 'root_agent')
 from presentation_agent.agents.report_understanding_agent.agent import agent as report_understanding_agent
@@ -35,14 +35,7 @@ def load_pdf_from_url_tool(url: str) -> str:
         return f"Error loading PDF from {url}: {str(e)}"
 
 
-# Create a wrapper agent for PDF loading (to integrate with SequentialAgent)
-pdf_loader_agent = LlmAgent(
-    name="PDFLoaderAgent",
-    model=Gemini(
-        model=DEFAULT_MODEL,
-        retry_options=RETRY_CONFIG,
-    ),
-    instruction="""You are a PDF Loader Agent. Your role is to load PDF content from URLs when provided.
+_PDF_LOADER_INSTRUCTION = """You are a PDF Loader Agent. Your role is to load PDF content from URLs when provided.
 
 When the user provides a [REPORT_URL], use the load_pdf_from_url_tool to fetch the PDF content.
 The tool will return the content formatted as [REPORT_CONTENT]...[/END_REPORT_CONTENT].
@@ -51,7 +44,14 @@ If no [REPORT_URL] is provided or it's "N/A", simply acknowledge that you'll use
 
 After loading (or if no URL provided), return a message indicating the content is ready for processing.
 Include the [REPORT_CONTENT] section in your response so downstream agents can access it.
-""",
+"""
+
+
+# Create a wrapper agent for PDF loading (to integrate with SequentialAgent)
+pdf_loader_agent = LlmAgent(
+    name="PDFLoaderAgent",
+    model=get_shared_model(DEFAULT_MODEL),
+    instruction=_PDF_LOADER_INSTRUCTION,
     tools=[load_pdf_from_url_tool],
     output_key="pdf_content",
 )
@@ -5,18 +5,24 @@ This agent is a Plotly expert and handles data validation, transformation, and c
 """
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 import sys
 import os
 import logging
 import json
 import re
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import RETRY_CONFIG, DEFAULT_MODEL
+from config import DEFAULT_MODEL
+from presentation_agent.utils.model_provider import get_shared_model
 from pathlib import Path
 from presentation_agent.utils.instruction_loader import load_instruction
+from presentation_agent.utils.helpers import is_valid_chart_data
+from presentation_agent.core.json_parser import clean_json_string
 try:
     from presentation_agent.tools.chart_generator_tool import generate_chart_tool
     CHART_TOOL_AVAILABLE = True
@@ -27,6 +33,152 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Charts are rendered locally (Plotly + Kaleido), so a small pool is enough
+CHART_MAX_WORKERS = 4
+
+
+@dataclass(slots=True)
+class ChartJob:
+    """A planned chart render for one slide."""
+    slide_number: Any
+    visual_elements: Dict[str, Any]
+    tool_params: Dict[str, Any]
+
+
+def _build_chart_tool_params(chart_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build generate_chart_tool keyword arguments from a chart_spec.
+    
+    Args:
+        chart_spec: Chart specification from a slide's visual_elements
+    
+    Returns:
+        Keyword arguments for generate_chart_tool
+    """
+    tool_params = {
+        'chart_type': chart_spec.get('chart_type', 'bar'),
+        'data': chart_spec.get('data', {}),
+        'title': chart_spec.get('title', 'Chart'),
+        'x_label': chart_spec.get('x_label'),
+        'y_label': chart_spec.get('y_label'),
+        'width': chart_spec.get('width', 800),
+        'height': chart_spec.get('height', 600),
+    }
+    for optional_key in ('color', 'colors', 'highlighted_items'):
+        value = chart_spec.get(optional_key)
+        if value:
+            tool_params[optional_key] = value
+    return tool_params
+
+
+def _plan_chart_jobs(slide_deck: Dict[str, Any]) -> Tuple[List[ChartJob], int]:
+    """
+    Collect the slides that still need a chart rendered.
+    
+    Args:
+        slide_deck: Slide deck dictionary
+    
+    Returns:
+        Tuple of (jobs, skipped_count)
+    """
+    jobs = []
+    charts_failed = 0
+    
+    for slide in slide_deck.get('slides', []):
+        slide_number = slide.get('slide_number')
+        visual_elements = slide.get('visual_elements', {})
+        chart_spec = visual_elements.get('chart_spec')
+        
+        # Skip if chart not needed
+        if not visual_elements.get('charts_needed', False) or not chart_spec:
+            continue
+        
+        # Skip if chart_data already exists and is valid (not placeholder)
+        if is_valid_chart_data(visual_elements.get('chart_data')):
+            logger.info(f"   ✅ Slide {slide_number}: Chart data already exists, skipping")
+            continue
+        
+        if not chart_spec.get('data'):
+            logger.warning(f"   ⚠️  Slide {slide_number}: Empty data in chart_spec")
+            charts_failed += 1
+            continue
+        
+        if not CHART_TOOL_AVAILABLE:
+            logger.error(f"   ❌ Slide {slide_number}: Chart tool not available")
+            charts_failed += 1
+            continue
+        
+        tool_params = _build_chart_tool_params(chart_spec)
+        if 'highlighted_items' in tool_params:
+            logger.info(f"   📌 Slide {slide_number}: Highlighting items: {tool_params['highlighted_items']}")
+        # Make sure the slide owns the visual_elements dict we write chart_data into
+        slide['visual_elements'] = visual_elements
+        jobs.append(ChartJob(slide_number, visual_elements, tool_params))
+    
+    return jobs, charts_failed
+
+
+def _execute_chart_jobs(jobs: List[ChartJob]) -> Tuple[int, int]:
+    """
+    Render planned charts concurrently and write chart_data back into each slide.
+    
+    Args:
+        jobs: Jobs returned by _plan_chart_jobs
+    
+    Returns:
+        Tuple of (charts_generated, charts_failed)
+    """
+    if not jobs:
+        return 0, 0
+    
+    charts_generated = 0
+    charts_failed = 0
+    logger.info(f"   📊 Generating {len(jobs)} chart(s) in parallel...")
+    
+    with ThreadPoolExecutor(max_workers=min(CHART_MAX_WORKERS, len(jobs))) as executor:
+        future_to_job = {
+            executor.submit(generate_chart_tool, **job.tool_params): job
+            for job in jobs
+        }
+        for future in as_completed(future_to_job):
+            job = future_to_job[future]
+            slide_number = job.slide_number
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"   ❌ Slide {slide_number}: Error generating chart: {e}\n{traceback.format_exc()}")
+                charts_failed += 1
+                continue
+            
+            chart_data = result.get('chart_data')
+            if result.get('status') == 'success' and chart_data:
+                job.visual_elements['chart_data'] = chart_data
+                charts_generated += 1
+                logger.info(f"   ✅ Slide {slide_number}: Chart generated successfully (base64 length: {len(chart_data)})")
+            else:
+                error_msg = result.get('error', 'Unknown error')
+                logger.warning(f"   ⚠️  Slide {slide_number}: Chart generation failed: {error_msg}")
+                charts_failed += 1
+    
+    return charts_generated, charts_failed
+
+
+def generate_deck_charts(slide_deck: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Render every missing chart in a slide deck, writing chart_data in place.
+    
+    Pure Python: plans the jobs and renders them concurrently, with no LLM call.
+    
+    Args:
+        slide_deck: Slide deck dictionary (modified in place)
+    
+    Returns:
+        Tuple of (charts_generated, charts_failed)
+    """
+    jobs, charts_failed = _plan_chart_jobs(slide_deck)
+    charts_generated, execution_failures = _execute_chart_jobs(jobs)
+    return charts_generated, charts_failed + execution_failures
+
 
 def call_chart_generation_after_agent(callback_context):
     """
@@ -102,22 +254,8 @@ def call_chart_generation_after_agent(callback_context):
         # Parse if it's a string
         if isinstance(slide_deck, str):
             try:
-                cleaned = slide_deck.strip()
-                if cleaned.startswith("```json"):
-                    cleaned = cleaned[7:].lstrip()
-                elif cleaned.startswith("```"):
-                    cleaned = cleaned[3:].lstrip()
-                if cleaned.endswith("```"):
-                    cleaned = cleaned[:-3].rstrip()
-                
-                # Fix Python-style booleans
-                cleaned = re.sub(r'\bTrue\b', 'true', cleaned)
-                cleaned = re.sub(r'\bFalse\b', 'false', cleaned)
-                cleaned = re.sub(r'\bNone\b', 'null', cleaned)
-                # Fix invalid escape sequences
-                cleaned = re.sub(r"\\'", "'", cleaned)
-                
-                slide_deck = json.loads(cleaned)
+                # Strip fences and fix Python-style booleans / invalid escapes
+                slide_deck = json.loads(clean_json_string(slide_deck))
             except json.JSONDecodeError as e:
                 logger.error(f"   ❌ Failed to parse slide_deck: {e}")
                 return None
@@ -126,92 +264,7 @@ def call_chart_generation_after_agent(callback_context):
             logger.error("   ❌ Invalid slide_deck format")
             return None
         
-        # Process each slide and generate charts
-        charts_generated = 0
-        charts_failed = 0
-        
-        for slide in slide_deck.get('slides', []):
-            slide_number = slide.get('slide_number')
-            visual_elements = slide.get('visual_elements', {})
-            
-            charts_needed = visual_elements.get('charts_needed', False)
-            chart_spec = visual_elements.get('chart_spec')
-            chart_data = visual_elements.get('chart_data')
-            
-            # Skip if chart not needed or already has data
-            if not charts_needed or not chart_spec:
-                continue
-            
-            # Skip if chart_data already exists and is valid (not placeholder)
-            from presentation_agent.utils.helpers import is_valid_chart_data
-            if is_valid_chart_data(chart_data):
-                logger.info(f"   ✅ Slide {slide_number}: Chart data already exists, skipping")
-                continue
-            
-            # Generate chart
-            logger.info(f"   📊 Generating chart for slide {slide_number}...")
-            
-            try:
-                # Extract parameters from chart_spec
-                chart_type = chart_spec.get('chart_type', 'bar')
-                data = chart_spec.get('data', {})
-                title = chart_spec.get('title', 'Chart')
-                x_label = chart_spec.get('x_label')
-                y_label = chart_spec.get('y_label')
-                width = chart_spec.get('width', 800)
-                height = chart_spec.get('height', 600)
-                color = chart_spec.get('color')
-                colors = chart_spec.get('colors')
-                highlighted_items = chart_spec.get('highlighted_items')
-                
-                # Validate data
-                if not data or len(data) == 0:
-                    logger.warning(f"   ⚠️  Slide {slide_number}: Empty data in chart_spec")
-                    charts_failed += 1
-                    continue
-                
-                # Call the tool to generate the chart
-                if not CHART_TOOL_AVAILABLE:
-                    logger.error(f"   ❌ Slide {slide_number}: Chart tool not available")
-                    charts_failed += 1
-                    continue
-                
-                # Build tool call parameters
-                tool_params = {
-                    'chart_type': chart_type,
-                    'data': data,
-                    'title': title,
-                    'x_label': x_label,
-                    'y_label': y_label,
-                    'width': width,
-                    'height': height,
-                }
-                if color:
-                    tool_params['color'] = color
-                if colors:
-                    tool_params['colors'] = colors
-                if highlighted_items:
-                    tool_params['highlighted_items'] = highlighted_items
-                    logger.info(f"   📌 Slide {slide_number}: Highlighting items: {highlighted_items}")
-                
-                result = generate_chart_tool(**tool_params)
-                
-                if result.get('status') == 'success' and result.get('chart_data'):
-                    chart_data = result.get('chart_data')
-                    # Update slide_deck with generated chart_data
-                    visual_elements['chart_data'] = chart_data
-                    slide['visual_elements'] = visual_elements
-                    charts_generated += 1
-                    logger.info(f"   ✅ Slide {slide_number}: Chart generated successfully (base64 length: {len(chart_data)})")
-                else:
-                    error_msg = result.get('error', 'Unknown error')
-                    logger.warning(f"   ⚠️  Slide {slide_number}: Chart generation failed: {error_msg}")
-                    charts_failed += 1
-                    
-            except Exception as e:
-                import traceback
-                logger.error(f"   ❌ Slide {slide_number}: Error generating chart: {e}\n{traceback.format_exc()}")
-                charts_failed += 1
+        charts_generated, charts_failed = generate_deck_charts(slide_deck)
         
         # Update session.state with modified slide_deck
         if hasattr(callback_context, 'state'):
@@ -252,7 +305,6 @@ def call_chart_generation_after_agent(callback_context):
         }
         
     except Exception as e:
-        import traceback
         logger.error(f"❌ Error in chart generation callback: {e}\n{traceback.format_exc()}")
         return None
 
@@ -264,10 +316,7 @@ _instruction = load_instruction(_agent_dir)
 
 agent = LlmAgent(
     name="ChartGeneratorAgent",
-    model=Gemini(
-        model=DEFAULT_MODEL,
-        retry_options=RETRY_CONFIG,
-    ),
+    model=get_shared_model(DEFAULT_MODEL),
     instruction=_instruction,
     tools=[],  # No tools - chart generation happens in callback
     output_key="chart_generation_status",
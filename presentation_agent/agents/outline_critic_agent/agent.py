@@ -9,6 +9,7 @@ Implementation:
 - Uses Gemini 2.5 Flash (stronger model) instead of Flash Lite for better judgment
 - Evaluates multiple dimensions: completeness, coherence, relevance, accuracy
 - Outputs structured review with quality score, acceptability flag, and actionable feedback
+- Uses output_schema (OutlineCriticReview) so Gemini emits schema-valid JSON directly
 
 Design:
 - No tools required - pure LLM-based evaluation
@@ -26,15 +27,16 @@ Behavior:
 """
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 import sys
 import os
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import RETRY_CONFIG, CRITIC_MODEL
+from config import CRITIC_MODEL
+from presentation_agent.utils.model_provider import get_shared_model
 from pathlib import Path
 from presentation_agent.utils.instruction_loader import load_instruction
+from presentation_agent.agents.outline_critic_agent.schema import OutlineCriticReview
 
 # Load instruction from markdown file
 _agent_dir = Path(__file__).parent
@@ -42,12 +44,11 @@ _instruction = load_instruction(_agent_dir)
 
 agent = LlmAgent(
     name="OutlineCriticAgent",
-    model=Gemini(
-        model=CRITIC_MODEL,
-        retry_options=RETRY_CONFIG,
-    ),
+    model=get_shared_model(CRITIC_MODEL),
     instruction=_instruction,
     tools=[],
+    # JSON shape is enforced at decoding time, so the instruction only carries evaluation criteria
+    output_schema=OutlineCriticReview,
     output_key="critic_review_outline",
 )
 
@@ -0,0 +1,18 @@
+"""
+Structured output schema for the Outline Critic Agent.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class OutlineCriticReview(BaseModel):
+    """Review of a presentation outline, enforced by Gemini's JSON decoding."""
+
+    overall_quality_score: float = Field(description="Overall outline quality, 0-100")
+    is_acceptable: bool = Field(description="True if overall_quality_score >= 70")
+    strengths: List[str] = Field(default_factory=list, description="What the outline does well")
+    weaknesses: List[str] = Field(default_factory=list, description="Problems found in the outline")
+    recommendations: List[str] = Field(default_factory=list, description="Actionable improvements")
+    evaluation_notes: str = Field(default="", description="Brief summary of the evaluation")
@@ -8,6 +8,7 @@ Implementation:
 - Uses Gemini 2.5 Flash Lite for fast, cost-effective generation
 - Loads instructions from markdown file for maintainability
 - Outputs structured JSON with slide breakdown and timing information
+- Uses output_schema (PresentationOutline) so Gemini emits schema-valid JSON directly
 
 Design:
 - No tools required - pure LLM-based generation
@@ -22,15 +23,16 @@ Behavior:
 """
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 import sys
 import os
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import RETRY_CONFIG, DEFAULT_MODEL
+from config import DEFAULT_MODEL
+from presentation_agent.utils.model_provider import get_shared_model
 from pathlib import Path
 from presentation_agent.utils.instruction_loader import load_instruction
+from presentation_agent.agents.outline_generator_agent.schema import PresentationOutline
 
 # Load instruction from markdown file
 _agent_dir = Path(__file__).parent
@@ -38,12 +40,11 @@ _instruction = load_instruction(_agent_dir)
 
 agent = LlmAgent(
     name="OutlineGeneratorAgent",
-    model=Gemini(
-        model=DEFAULT_MODEL,
-        retry_options=RETRY_CONFIG,
-    ),
+    model=get_shared_model(DEFAULT_MODEL),
     instruction=_instruction,
     tools=[],
+    # JSON shape is enforced at decoding time, so the instruction does not spell out the skeleton
+    output_schema=PresentationOutline,
     output_key="presentation_outline",
 )
 
@@ -0,0 +1,38 @@
+"""
+Structured output schema for the Outline Generator Agent.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class OutlineSlide(BaseModel):
+    """One slide in the presentation outline."""
+
+    slide_number: int
+    slide_type: str = Field(description="title | content | conclusion")
+    title: str
+    key_points: List[str] = Field(default_factory=list)
+    estimated_time: str = Field(description="Time in seconds")
+    content_notes: str = Field(default="", description="Brief notes on slide content and suggested layout")
+    figures_to_include: List[str] = Field(default_factory=list, description="Figure ids from report_knowledge")
+
+
+class TimeAllocation(BaseModel):
+    """Time split across the presentation."""
+
+    introduction: str
+    main_content: str
+    conclusion: str
+
+
+class PresentationOutline(BaseModel):
+    """Presentation outline, enforced by Gemini's JSON decoding."""
+
+    presentation_title: str
+    estimated_duration: str
+    slides: List[OutlineSlide]
+    total_slides: int
+    time_allocation: TimeAllocation
+    outline_notes: str = Field(default="", description="Structure notes")
@@ -9,6 +9,7 @@ Implementation:
 - Uses Gemini 2.5 Flash Lite for efficient text understanding
 - Processes PDF content (loaded via utility function before agent execution)
 - Outputs structured JSON with sections, key takeaways, figures, and metadata
+- Uses JSON response mode so decoding is constrained to a single JSON object
 
 Design:
 - No tools required - pure LLM-based extraction
@@ -24,13 +25,14 @@ Behavior:
 """
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
+from google.genai import types
 import sys
 import os
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import RETRY_CONFIG, DEFAULT_MODEL
+from config import DEFAULT_MODEL
+from presentation_agent.utils.model_provider import get_shared_model
 from pathlib import Path
 from presentation_agent.utils.instruction_loader import load_instruction
 
@@ -40,12 +42,13 @@ _instruction = load_instruction(_agent_dir)
 
 agent = LlmAgent(
     name="ReportUnderstandingAgent",
-    model=Gemini(
-        model=DEFAULT_MODEL,
-        retry_options=RETRY_CONFIG,
-    ),
+    model=get_shared_model(DEFAULT_MODEL),
     instruction=_instruction,
     tools=[],
+    # Constrained JSON decoding: no code fences or prose to generate, strip or retry on
+    generate_content_config=types.GenerateContentConfig(
+        response_mime_type="application/json",
+    ),
     output_key="report_knowledge",
 )
 
@@ -1,33 +1,45 @@
 """
 Core pipeline components following SOLID principles.
+
+Exports are resolved lazily (PEP 562): importing a light module such as
+presentation_agent.core.json_parser does not import the orchestrator and
+the ADK runner/session stack behind it.
 """
 
-from .pipeline_orchestrator import PipelineOrchestrator
-from .agent_executor import AgentExecutor
-from .json_parser import parse_json_robust, clean_json_string, extract_json_from_text
-from .serialization_service import SerializationService
-from .cache_manager import CacheManager
-from .agent_registry import AgentRegistry, create_default_agent_registry
-from .slide_generation_handler import SlideGenerationHandler
-from .outline_generation_handler import OutlineGenerationHandler
-from .web_slides_generation_handler import WebSlidesGenerationHandler
-from .context_builder import ContextBuilder
-from .serialization_manager import SerializationManager
-
-__all__ = [
-    "PipelineOrchestrator",
-    "AgentExecutor",
-    "parse_json_robust",
-    "clean_json_string",
-    "extract_json_from_text",
-    "SerializationService",
-    "SerializationManager",
-    "CacheManager",
-    "AgentRegistry",
-    "create_default_agent_registry",
-    "SlideGenerationHandler",
-    "OutlineGenerationHandler",
-    "WebSlidesGenerationHandler",
-    "ContextBuilder",
-]
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "PipelineOrchestrator": ".pipeline_orchestrator",
+    "AgentExecutor": ".agent_executor",
+    "parse_json_robust": ".json_parser",
+    "clean_json_string": ".json_parser",
+    "extract_json_from_text": ".json_parser",
+    "SerializationService": ".serialization_service",
+    "SerializationManager": ".serialization_manager",
+    "CacheManager": ".cache_manager",
+    "AgentRegistry": ".agent_registry",
+    "create_default_agent_registry": ".agent_registry",
+    "SlideGenerationHandler": ".slide_generation_handler",
+    "OutlineGenerationHandler": ".outline_generation_handler",
+    "WebSlidesGenerationHandler": ".web_slides_generation_handler",
+    "ContextBuilder": ".context_builder",
+    "StageGraph": ".stage_graph",
+    "ResponseCache": ".response_cache",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import an exported name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
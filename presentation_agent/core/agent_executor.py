@@ -3,15 +3,34 @@ Agent execution utilities.
 Extracted from main.py to follow Single Responsibility Principle.
 """
 
+import itertools
 import json
 import logging
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Iterable, List, Tuple
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import InMemoryRunner
+from google.genai import types
 # Session type is dynamic from ADK
 
+from config import (
+    APP_NAME,
+    USER_ID,
+    LLM_STREAMING,
+    CONTEXT_CACHE_MIN_TOKENS,
+    CONTEXT_CACHE_TTL_SECONDS,
+    CONTEXT_CACHE_INTERVALS,
+)
+
 from presentation_agent.utils.helpers import extract_output_from_events
-from presentation_agent.core.json_parser import parse_json_robust
+from presentation_agent.core.json_parser import (
+    parse_json_robust,
+    extract_json_from_text,
+    fix_incomplete_json,
+    is_json_syntax_error,
+)
 from presentation_agent.core.exceptions import AgentExecutionError, JSONParseError
+from presentation_agent.core.context_builder import ContextBuilder
+from presentation_agent.core.response_cache import ResponseCache
 from presentation_agent.core.logging_utils import (
     get_logger,
     log_agent_error,
@@ -23,14 +42,55 @@ from presentation_agent.core.logging_utils import (
 
 logger = get_logger(__name__)
 
+# Context caching requires an ADK version with App + ContextCacheConfig
+try:
+    from google.adk.apps.app import App
+    from google.adk.agents.context_cache_config import ContextCacheConfig
+    CONTEXT_CACHE_AVAILABLE = True
+    _CONTEXT_CACHE_CONFIG = ContextCacheConfig(
+        min_tokens=CONTEXT_CACHE_MIN_TOKENS,
+        ttl_seconds=CONTEXT_CACHE_TTL_SECONDS,
+        cache_intervals=CONTEXT_CACHE_INTERVALS,
+    )
+except ImportError:
+    CONTEXT_CACHE_AVAILABLE = False
+    _CONTEXT_CACHE_CONFIG = None
+    logger.debug("ADK context caching not available, static instructions are resent on every call")
+
+# SSE streaming lets the first tokens arrive while the model is still generating;
+# partial events are consumed as they stream and only complete events are kept
+_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE if LLM_STREAMING else StreamingMode.NONE)
+
+# Process-wide runner pool: agents are singletons (see agent_registry), so one
+# runner per agent is reused by every pipeline run, retry and critic pass.
+# Keyed by id(agent); the agent is kept in the entry so the id stays valid.
+_RUNNER_POOL: Dict[int, Tuple[Any, InMemoryRunner]] = {}
+
 
 class AgentExecutor:
     """
     Handles agent execution with consistent error handling and output parsing.
     """
     
-    def __init__(self, session: Any):
+    def __init__(
+        self,
+        session: Any,
+        response_cache: Optional[ResponseCache] = None,
+        cacheable_agents: Iterable[str] = ()
+    ):
+        """
+        Initialize agent executor.
+        
+        Args:
+            session: Pipeline session (its id namespaces the per-call runner sessions)
+            response_cache: Optional cache of parsed JSON outputs; a hit skips the LLM call
+            cacheable_agents: Names of agents whose outputs may be cached and replayed
+                (outputs of every other agent always come from the model)
+        """
         self.session = session
+        self.response_cache = response_cache
+        self.cacheable_agents = frozenset(cacheable_agents)
+        self._run_counter = itertools.count(1)
     
     async def run_agent(
         self,
@@ -57,8 +117,103 @@ class AgentExecutor:
             JSONParseError: If JSON parsing fails when parse_json=True
         """
         agent_name = agent.name if hasattr(agent, 'name') else 'Unknown'
-        runner = InMemoryRunner(agent=agent)
-        events = await runner.run_debug(user_message, session_id=self.session.id)
+        
+        # Only parsed JSON outputs of replay-safe agents are cached
+        cache_key = None
+        if self._is_cacheable(agent_name, parse_json):
+            cache_key = self._response_cache_key(agent, user_message)
+            cached_output = self.response_cache.get(cache_key)
+            if cached_output is not None:
+                log_agent_info(
+                    logger,
+                    "Output loaded from response cache (LLM call skipped)",
+                    agent_name=agent_name,
+                    context={"output_key": output_key}
+                )
+                return cached_output
+        
+        output = await self._run_and_extract(agent, agent_name, user_message, output_key, parse_json)
+        if cache_key is not None and isinstance(output, dict):
+            self.response_cache.set(cache_key, output)
+        return output
+    
+    def discard_cached_response(self, agent: Any, user_message: str) -> None:
+        """
+        Drop the cached output of an agent call.
+        
+        Callers that validate an output after run_agent() use this when
+        validation fails, so the rejected output is not served again.
+        
+        Args:
+            agent: The ADK agent that produced the output
+            user_message: Input message the agent was called with
+        """
+        agent_name = agent.name if hasattr(agent, 'name') else 'Unknown'
+        if self._is_cacheable(agent_name, parse_json=True):
+            self.response_cache.delete(self._response_cache_key(agent, user_message))
+    
+    def _is_cacheable(self, agent_name: str, parse_json: bool) -> bool:
+        """
+        Check whether an agent call's output may be served from / stored in the response cache.
+        
+        Args:
+            agent_name: Name of the agent being run
+            parse_json: Whether the call parses JSON output (only parsed outputs are cached)
+        
+        Returns:
+            True if the cache is enabled and the agent is listed as cacheable
+        """
+        return (
+            parse_json
+            and self.response_cache is not None
+            and self.response_cache.enabled
+            and agent_name in self.cacheable_agents
+        )
+    
+    @staticmethod
+    def _response_cache_key(agent: Any, user_message: str) -> str:
+        """
+        Build the response cache key for an agent call.
+        
+        Args:
+            agent: The ADK agent to execute
+            user_message: Input message for the agent
+        
+        Returns:
+            Cache key covering the agent, its model, its instruction and the message
+        """
+        model = getattr(agent, 'model', '')
+        model_name = model if isinstance(model, str) else getattr(model, 'model', '')
+        instruction = getattr(agent, 'instruction', '')
+        return ResponseCache.make_key(
+            f"{getattr(agent, 'name', 'Unknown')}@{model_name}",
+            user_message,
+            instruction=instruction if isinstance(instruction, str) else ""
+        )
+    
+    async def _run_and_extract(
+        self,
+        agent: Any,
+        agent_name: str,
+        user_message: str,
+        output_key: str,
+        parse_json: bool
+    ) -> Any:
+        """
+        Run the agent and extract (and optionally parse) its output.
+        
+        Args:
+            agent: The ADK agent to execute
+            agent_name: Agent name for logging
+            user_message: Input message for the agent
+            output_key: Key to extract from agent output
+            parse_json: Whether to parse JSON from string output
+        
+        Returns:
+            Agent output (parsed if parse_json=True)
+        """
+        runner = self._get_runner(agent)
+        events = await self._collect_events(runner, user_message)
         
         # Log total events for debugging
         log_agent_info(
@@ -217,26 +372,10 @@ class AgentExecutor:
             if parsed:
                 return parsed
             
-            # If parsing fails, try one more time with extract_json_from_text directly
-            # This handles cases where clean_json_string might have affected extraction
-            from presentation_agent.core.json_parser import extract_json_from_text, fix_incomplete_json
+            # If parsing fails, try once more on the raw output (clean_json_string
+            # can occasionally break extraction); fix truncation only if needed
             json_str = extract_json_from_text(output)
             if json_str:
-                # Try fixing incomplete JSON before parsing
-                fixed_json = fix_incomplete_json(json_str)
-                if fixed_json and fixed_json != json_str:
-                    try:
-                        parsed = json.loads(fixed_json)
-                        if isinstance(parsed, dict):
-                            log_agent_info(
-                                logger,
-                                f"Successfully parsed fixed incomplete JSON for key '{output_key}'",
-                                agent_name=agent_name,
-                                context={"output_key": output_key}
-                            )
-                            return parsed
-                    except json.JSONDecodeError:
-                        pass
                 log_agent_debug(
                     logger,
                     f"Extracted JSON string for key '{output_key}'",
@@ -247,7 +386,6 @@ class AgentExecutor:
                         "last_500_chars": json_str[-500:]
                     }
                 )
-                # Try parsing with retry for incomplete JSON
                 try:
                     parsed = json.loads(json_str)
                     if isinstance(parsed, dict):
@@ -260,10 +398,9 @@ class AgentExecutor:
                         return parsed
                 except json.JSONDecodeError as e:
                     # Check if it's a syntax error (should retry LLM) or incomplete (can fix)
-                    from presentation_agent.core.json_parser import is_json_syntax_error
                     is_syntax_error = is_json_syntax_error(e)
                     
-                    if not is_syntax_error and fix_incomplete:
+                    if not is_syntax_error:
                         # Try fixing incomplete JSON (truncated response)
                         fixed_json = fix_incomplete_json(json_str)
                         if fixed_json and fixed_json != json_str:
@@ -272,7 +409,7 @@ class AgentExecutor:
                                 if isinstance(parsed, dict):
                                     log_agent_info(
                                         logger,
-                                        f"Successfully parsed fixed incomplete JSON on retry for key '{output_key}'",
+                                        f"Successfully parsed fixed incomplete JSON for key '{output_key}'",
                                         agent_name=agent_name,
                                         context={"output_key": output_key}
                                     )
@@ -319,6 +456,98 @@ class AgentExecutor:
         
         return output
     
+    @staticmethod
+    def _build_runner(agent: Any) -> InMemoryRunner:
+        """
+        Build a runner for an agent, with Gemini context caching when available.
+        
+        With context caching, the agent's static instruction is stored once as
+        Gemini cached content and referenced by later requests instead of being
+        prefilled again on every call.
+        
+        Args:
+            agent: The ADK agent to execute
+        
+        Returns:
+            InMemoryRunner for the agent
+        """
+        if CONTEXT_CACHE_AVAILABLE:
+            app = App(
+                name=APP_NAME,
+                root_agent=agent,
+                context_cache_config=_CONTEXT_CACHE_CONFIG,
+            )
+            return InMemoryRunner(app=app)
+        return InMemoryRunner(agent=agent)
+    
+    @classmethod
+    def _get_runner(cls, agent: Any) -> InMemoryRunner:
+        """
+        Get the pooled runner for an agent, building it on first use.
+        
+        Args:
+            agent: The ADK agent to execute
+        
+        Returns:
+            InMemoryRunner shared by every run of this agent
+        """
+        entry = _RUNNER_POOL.get(id(agent))
+        if entry is not None and entry[0] is agent:
+            return entry[1]
+        runner = cls._build_runner(agent)
+        _RUNNER_POOL[id(agent)] = (agent, runner)
+        return runner
+    
+    async def _collect_events(self, runner: InMemoryRunner, user_message: str) -> List[Any]:
+        """
+        Run an agent through runner.run_async() and collect its events.
+        
+        Uses the non-blocking async runner API directly instead of run_debug(),
+        which also pretty-prints every event to the console. When LLM_STREAMING
+        is enabled, partial (streamed) events are counted but not collected, so
+        output extraction only sees complete events.
+        
+        Args:
+            runner: Runner wrapping the agent to execute
+            user_message: Input message for the agent
+        
+        Returns:
+            List of events emitted during the run
+        """
+        # Runners are pooled, so every call gets its own short-lived session:
+        # the agent sees no history from earlier calls, as with a fresh runner
+        session_id = f"{self.session.id}-{next(self._run_counter)}"
+        await runner.session_service.create_session(
+            app_name=runner.app_name,
+            user_id=USER_ID,
+            session_id=session_id
+        )
+        
+        new_message = types.Content(role="user", parts=[types.Part(text=user_message)])
+        events = []
+        partial_events = 0
+        try:
+            async for event in runner.run_async(
+                user_id=USER_ID,
+                session_id=session_id,
+                new_message=new_message,
+                run_config=_RUN_CONFIG
+            ):
+                if getattr(event, 'partial', False):
+                    partial_events += 1
+                    continue
+                events.append(event)
+        finally:
+            await runner.session_service.delete_session(
+                app_name=runner.app_name,
+                user_id=USER_ID,
+                session_id=session_id
+            )
+        
+        if partial_events:
+            logger.debug(f"Consumed {partial_events} streamed partial event(s)")
+        return events
+    
     def build_critic_input(
         self,
         presentation_outline: Dict,
@@ -342,16 +571,7 @@ class AgentExecutor:
         Returns:
             Formatted input message
         """
-        scenario_section = (
-            f"[SCENARIO]\n{config.scenario}\n\n"
-            if config.scenario and config.scenario.strip()
-            else "[SCENARIO]\nN/A\n\n"
-        )
-        target_audience_section = (
-            f"[TARGET_AUDIENCE]\n{config.target_audience}\n\n"
-            if config.target_audience
-            else "[TARGET_AUDIENCE]\nN/A\n\n"
-        )
+        scenario_section, target_audience_section, _ = ContextBuilder.build_config_sections(config)
         custom_instruction_section = (
             f"[CUSTOM_INSTRUCTION]\n{custom_instruction}\n\n"
             if custom_instruction and custom_instruction.strip()
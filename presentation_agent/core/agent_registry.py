@@ -3,7 +3,8 @@ Agent registry for dependency injection.
 Extracted from PipelineOrchestrator to follow Dependency Inversion Principle.
 """
 
-from typing import Dict, Any, Optional, Protocol
+from functools import lru_cache
+from typing import Dict, Any, Optional, Protocol, Tuple
 from abc import ABC
 
 
@@ -74,15 +75,18 @@ class AgentRegistry:
         return self._agents.copy()
 
 
-def create_default_agent_registry() -> AgentRegistry:
+@lru_cache(maxsize=1)
+def _load_default_agents() -> Tuple[Tuple[str, Any], ...]:
     """
-    Create and populate the default agent registry with all pipeline agents.
+    Import the default pipeline agents once per process.
+    
+    ADK agents are stateless configuration (session state lives in the
+    runner/session service), so the same instances are shared by every
+    registry instead of re-resolving the imports on each pipeline run.
     
     Returns:
-        AgentRegistry instance with all agents registered
+        Tuple of (name, agent) pairs
     """
-    registry = AgentRegistry()
-    
     # Import agents (lazy import to avoid circular dependencies)
     from presentation_agent.agents.report_understanding_agent.agent import agent as report_understanding_agent
     from presentation_agent.agents.outline_generator_agent.agent import agent as outline_generator_agent
@@ -90,12 +94,26 @@ def create_default_agent_registry() -> AgentRegistry:
     from presentation_agent.agents.slide_and_script_generator_agent.agent import agent as slide_and_script_generator_agent
     from presentation_agent.agents.chart_generator_agent.agent import agent as chart_generator_agent
     
-    # Register all agents
-    registry.register("report_understanding", report_understanding_agent)
-    registry.register("outline_generator", outline_generator_agent)
-    registry.register("outline_critic", outline_critic_agent)
-    registry.register("slide_and_script_generator", slide_and_script_generator_agent)
-    registry.register("chart_generator", chart_generator_agent)
+    return (
+        ("report_understanding", report_understanding_agent),
+        ("outline_generator", outline_generator_agent),
+        ("outline_critic", outline_critic_agent),
+        ("slide_and_script_generator", slide_and_script_generator_agent),
+        ("chart_generator", chart_generator_agent),
+    )
+
+
+def create_default_agent_registry() -> AgentRegistry:
+    """
+    Create and populate the default agent registry with all pipeline agents.
+    
+    Returns:
+        AgentRegistry instance with all agents registered
+    """
+    registry = AgentRegistry()
+    
+    # Register all agents (the registry itself stays per-pipeline so callers can override entries)
+    for name, agent in _load_default_agents():
+        registry.register(name, agent)
     
     return registry
-
@@ -5,9 +5,17 @@ Extracted from main.py to follow Single Responsibility Principle.
 
 import os
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Optional
-from config import OUTPUT_DIR, LOGGER_LOG_FILE, WEB_LOG_FILE, TUNNEL_LOG_FILE, OBSERVABILITY_LOG_FILE
+from config import (
+    OUTPUT_DIR,
+    LOGGER_LOG_FILE,
+    WEB_LOG_FILE,
+    TUNNEL_LOG_FILE,
+    OBSERVABILITY_LOG_FILE,
+    LOG_BUFFER_CAPACITY,
+)
 
 
 class AppInitializer:
@@ -33,12 +41,16 @@ class AppInitializer:
                 new_log_path.unlink()
                 print(f"🧹 Cleaned up {new_log_path}")
         
-        # Configure logging
-        logging.basicConfig(
-            filename=str(self.output_dir / LOGGER_LOG_FILE),
-            level=logging.DEBUG,
-            format="%(filename)s:%(lineno)s %(levelname)s:%(message)s",
+        # Configure logging: the pipeline emits many DEBUG records, so buffer them
+        # and write in batches instead of one write() per record
+        file_handler = logging.FileHandler(str(self.output_dir / LOGGER_LOG_FILE))
+        file_handler.setFormatter(logging.Formatter("%(filename)s:%(lineno)s %(levelname)s:%(message)s"))
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
         )
+        logging.basicConfig(level=logging.DEBUG, handlers=[buffered_handler])
         print("✅ Logging configured")
     
     def load_environment(self) -> None:
@@ -3,7 +3,7 @@ Context builder - extracts relevant report sections for slide generation.
 """
 
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 from itertools import product, chain
 
 logger = logging.getLogger(__name__)
@@ -107,6 +107,44 @@ class ContextBuilder:
         
         return slide_to_sections
     
+    @staticmethod
+    def build_config_sections(
+        config: Any,
+        scenario_fallback: str = "N/A",
+        target_audience_fallback: str = "N/A"
+    ) -> Tuple[str, str, str]:
+        """
+        Build the [SCENARIO], [TARGET_AUDIENCE] and [CUSTOM_INSTRUCTION] message sections.
+        
+        Shared by every agent message that carries the presentation config, so
+        all of them treat empty/missing values the same way.
+        
+        Args:
+            config: PresentationConfig object
+            scenario_fallback: Text used when no scenario is provided
+            target_audience_fallback: Text used when no target audience is provided
+        
+        Returns:
+            Tuple of (scenario_section, target_audience_section, custom_instruction_section);
+            custom_instruction_section is empty when there is no custom instruction
+        """
+        scenario = config.scenario if config.scenario and config.scenario.strip() else scenario_fallback
+        target_audience = (
+            config.target_audience
+            if config.target_audience and config.target_audience.strip()
+            else target_audience_fallback
+        )
+        custom_instruction_section = (
+            f"[CUSTOM_INSTRUCTION]\n{config.custom_instruction}\n\n"
+            if config.custom_instruction and config.custom_instruction.strip()
+            else ""
+        )
+        return (
+            f"[SCENARIO]\n{scenario}\n\n",
+            f"[TARGET_AUDIENCE]\n{target_audience}\n\n",
+            custom_instruction_section,
+        )
+    
     @staticmethod
     def build_selective_context(
         outline: Dict,
@@ -4,9 +4,71 @@ Extracted from main.py to eliminate code duplication.
 """
 
 import json
+import logging
 import re
 from typing import Any, Optional, Dict
 
+# orjson is optional: parses large slide decks several times faster than json.loads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Wrapper keys that tool/agent responses may nest the real payload under (checked in order)
+_WRAPPER_KEYS = ("review_layout_tool_response", "tool_response", "response")
+
+# Leading ```json / ``` fence with an optional closing fence (truncated outputs may lack it)
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL)
+
+# clean_json_string() substitutions, compiled once
+_PY_TRUE_RE = re.compile(r'\bTrue\b')
+_PY_FALSE_RE = re.compile(r'\bFalse\b')
+_PY_NONE_RE = re.compile(r'\bNone\b')
+_ESCAPED_QUOTE_RE = re.compile(r"\\'")
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_LINE_COMMENT_RE = re.compile(r'//.*?$', re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+def strip_markdown_fences(text: str) -> str:
+    """
+    Strip a surrounding markdown code fence (```json ... ``` or ``` ... ```).
+    
+    Args:
+        text: Raw text that may be wrapped in a code fence
+        
+    Returns:
+        Text without the fence, stripped of surrounding whitespace
+    """
+    match = _FENCE_RE.match(text)
+    return match.group(1) if match else text.strip()
+
+
+def parse_json_maybe_fenced(text: str) -> Any:
+    """
+    Parse JSON that may be wrapped in a markdown code fence.
+    
+    Uses orjson when installed and falls back to the stdlib json module.
+    
+    Args:
+        text: JSON string, optionally inside ```json ... ```
+        
+    Returns:
+        Parsed JSON value
+        
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON
+    """
+    payload = strip_markdown_fences(text)
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which json accepts; json raises the real error
+    return json.loads(payload)
+
 
 def clean_json_string(text: str) -> str:
     """
@@ -18,30 +80,23 @@ def clean_json_string(text: str) -> str:
     Returns:
         Cleaned JSON string
     """
-    cleaned = text.strip()
-    
     # Remove markdown code blocks
-    if cleaned.startswith("```json"):
-        cleaned = cleaned[7:].lstrip()
-    elif cleaned.startswith("```"):
-        cleaned = cleaned[3:].lstrip()
-    if cleaned.endswith("```"):
-        cleaned = cleaned[:-3].rstrip()
+    cleaned = strip_markdown_fences(text)
     
     # Convert Python-style booleans to JSON-compliant
-    cleaned = re.sub(r'\bTrue\b', 'true', cleaned)
-    cleaned = re.sub(r'\bFalse\b', 'false', cleaned)
-    cleaned = re.sub(r'\bNone\b', 'null', cleaned)
+    cleaned = _PY_TRUE_RE.sub('true', cleaned)
+    cleaned = _PY_FALSE_RE.sub('false', cleaned)
+    cleaned = _PY_NONE_RE.sub('null', cleaned)
     
     # Fix invalid escape sequences (e.g., \' should be just ')
-    cleaned = re.sub(r"\\'", "'", cleaned)
+    cleaned = _ESCAPED_QUOTE_RE.sub("'", cleaned)
     
     # Remove trailing commas before closing brackets/braces
-    cleaned = re.sub(r',(\s*[}\]])', r'\1', cleaned)
+    cleaned = _TRAILING_COMMA_RE.sub(r'\1', cleaned)
     
     # Remove comments (// or /* */)
-    cleaned = re.sub(r'//.*?$', '', cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r'/\*.*?\*/', '', cleaned, flags=re.DOTALL)
+    cleaned = _LINE_COMMENT_RE.sub('', cleaned)
+    cleaned = _BLOCK_COMMENT_RE.sub('', cleaned)
     
     return cleaned
 
@@ -59,10 +114,6 @@ def extract_json_from_text(text: str) -> Optional[str]:
     Returns:
         Extracted JSON string, or None if not found
     """
-    import logging
-    import re
-    logger = logging.getLogger(__name__)
-    
     # First, try to find JSON in markdown code blocks
     # Look for ```json ... ``` or ``` ... ```
     # Extract the code block content first, then find the largest JSON object within it
@@ -199,10 +250,6 @@ def fix_json_syntax_errors(json_str: str) -> Optional[str]:
     Returns:
         Fixed JSON string, or None if fixing is not possible
     """
-    import logging
-    import re
-    logger = logging.getLogger(__name__)
-    
     fixed = json_str
     
     # Fix common issues:
@@ -235,9 +282,6 @@ def fix_incomplete_json(json_str: str) -> Optional[str]:
     Returns:
         Fixed JSON string, or None if fixing is not possible
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # Count unclosed structures (ignoring those inside strings)
     # Simple approach: count braces/brackets, but this can be fooled by strings
     # Better approach: track if we're inside a string
@@ -329,6 +373,22 @@ def is_json_syntax_error(error: json.JSONDecodeError) -> bool:
     return True
 
 
+def _unwrap(parsed: Dict) -> Any:
+    """
+    Return the payload nested under the first known wrapper key, if any.
+    
+    Args:
+        parsed: Parsed JSON dict
+        
+    Returns:
+        Wrapped payload, or the dict itself when no wrapper key is present
+    """
+    for wrapper_key in _WRAPPER_KEYS:
+        if wrapper_key in parsed:
+            return parsed[wrapper_key]
+    return parsed
+
+
 def parse_json_robust(text: Any, extract_wrapped: bool = True, fix_incomplete: bool = True) -> Optional[Dict]:
     """
     Robustly parse JSON from various formats (string, dict, with markdown, etc.).
@@ -342,17 +402,9 @@ def parse_json_robust(text: Any, extract_wrapped: bool = True, fix_incomplete: b
     Returns:
         Parsed JSON dict, or None if parsing fails
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     # If already a dict, return as is
     if isinstance(text, dict):
-        if extract_wrapped:
-            # Check for common wrapper keys
-            for wrapper_key in ["review_layout_tool_response", "tool_response", "response"]:
-                if wrapper_key in text:
-                    return text[wrapper_key]
-        return text
+        return _unwrap(text) if extract_wrapped else text
     
     # If not a string, convert to string
     if not isinstance(text, str):
@@ -365,12 +417,7 @@ def parse_json_robust(text: Any, extract_wrapped: bool = True, fix_incomplete: b
     try:
         parsed = json.loads(cleaned)
         if isinstance(parsed, dict):
-            if extract_wrapped:
-                # Check for wrapper keys
-                for wrapper_key in ["review_layout_tool_response", "tool_response", "response"]:
-                    if wrapper_key in parsed:
-                        return parsed[wrapper_key]
-            return parsed
+            return _unwrap(parsed) if extract_wrapped else parsed
     except json.JSONDecodeError:
         pass
     
@@ -381,11 +428,7 @@ def parse_json_robust(text: Any, extract_wrapped: bool = True, fix_incomplete: b
         try:
             parsed = json.loads(json_str)
             if isinstance(parsed, dict):
-                if extract_wrapped:
-                    for wrapper_key in ["review_layout_tool_response", "tool_response", "response"]:
-                        if wrapper_key in parsed:
-                            return parsed[wrapper_key]
-                return parsed
+                return _unwrap(parsed) if extract_wrapped else parsed
         except json.JSONDecodeError as e:
             logger.debug(f"Failed to parse extracted JSON: {e}")
             
@@ -397,11 +440,7 @@ def parse_json_robust(text: Any, extract_wrapped: bool = True, fix_incomplete: b
                         parsed = json.loads(fixed_json)
                         if isinstance(parsed, dict):
                             logger.debug("Successfully parsed fixed incomplete JSON")
-                            if extract_wrapped:
-                                for wrapper_key in ["review_layout_tool_response", "tool_response", "response"]:
-                                    if wrapper_key in parsed:
-                                        return parsed[wrapper_key]
-                            return parsed
+                            return _unwrap(parsed) if extract_wrapped else parsed
                     except json.JSONDecodeError:
                         logger.debug("Failed to parse fixed JSON")
     
@@ -4,11 +4,12 @@ Handles outline generation, evaluation, and retry logic with feedback loop.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, Optional, List
 from pathlib import Path
 
-from config import PresentationConfig, PRESENTATION_OUTLINE_FILE
-from presentation_agent.utils.helpers import save_json_output
+from config import PresentationConfig, PRESENTATION_OUTLINE_FILE, OUTLINE_REVIEW_FILE, OUTLINE_FAST_ACCEPT
+from presentation_agent.utils.helpers import save_json_outputs_async
 from presentation_agent.utils.observability import AgentStatus
 from presentation_agent.core.agent_executor import AgentExecutor
 from presentation_agent.core.json_parser import parse_json_robust
@@ -19,6 +20,13 @@ from presentation_agent.core.serialization_manager import SerializationManager
 
 logger = logging.getLogger(__name__)
 
+# Slide fields the slide generator needs from every outline entry
+_REQUIRED_OUTLINE_SLIDE_KEYS = ("slide_number", "title")
+
+# Figures worth fact-checking: multi-digit numbers or numbers with a decimal part
+# (small counts like "3 key findings" are not claims about the report)
+_FIGURE_RE = re.compile(r"\d+(?:[.,]\d+)+|\d{2,}")
+
 
 class OutlineGenerationHandler:
     """
@@ -36,6 +44,7 @@ class OutlineGenerationHandler:
         outputs: Dict[str, Any],
         output_dir: Path,
         save_intermediate: bool = True,
+        include_critics: bool = True,
     ):
         """
         Initialize the outline generation handler.
@@ -50,6 +59,7 @@ class OutlineGenerationHandler:
             outputs: Pipeline outputs dictionary (will be updated)
             output_dir: Output directory path
             save_intermediate: Whether to save intermediate outputs
+            include_critics: Whether to evaluate (and possibly retry) the outline with the critic agent
         """
         self.config = config
         self.executor = executor
@@ -60,6 +70,9 @@ class OutlineGenerationHandler:
         self.outputs = outputs
         self.output_dir = output_dir
         self.save_intermediate = save_intermediate
+        self.include_critics = include_critics
+        self._last_serialized_outline: Optional[tuple] = None  # (outline, compact JSON)
+        self._last_outline_message: Optional[str] = None  # Message that produced the current outline
         self.session = None  # Will be set by execute method
     
     async def execute(
@@ -112,11 +125,16 @@ class OutlineGenerationHandler:
         self.obs_logger.finish_agent_execution(AgentStatus.SUCCESS, "Outline generated successfully")
         
         # Evaluate outline quality using critic agent (stronger model for better judgment)
-        critic_review = await self._evaluate_outline(presentation_outline)
+        if self.include_critics:
+            critic_review = await self._evaluate_outline(presentation_outline)
+        else:
+            print("ℹ️  Critics disabled - skipping outline evaluation")
+            critic_review = None
         
         # Retry logic: If outline is unacceptable, regenerate with feedback (max 1 retry)
         # This implements the feedback loop pattern for quality assurance
         if critic_review and not critic_review.get("is_acceptable", False):
+            self._discard_rejected_outline()
             print("\n🔄 Outline not acceptable. Retrying with critic feedback and previous outline (max 1 retry)...")
             self.obs_logger.start_agent_execution("OutlineGeneratorAgent", output_key="presentation_outline")
             
@@ -133,6 +151,8 @@ class OutlineGenerationHandler:
                 # Re-evaluate the retried outline to check if improvements were made
                 print("\n🔍 Re-evaluating retried outline...")
                 critic_review = await self._evaluate_outline(presentation_outline)
+                if critic_review and not critic_review.get("is_acceptable", False):
+                    self._discard_rejected_outline()
             except (AgentExecutionError, JSONParseError) as e:
                 self.obs_logger.finish_agent_execution(AgentStatus.FAILED, str(e), has_output=False)
                 print(f"⚠️  Outline retry failed: {e}")
@@ -141,12 +161,13 @@ class OutlineGenerationHandler:
         
         # Store final outline
         self.outputs["presentation_outline"] = presentation_outline
-        self.session.state["presentation_outline"] = presentation_outline
+        if self.session.state.get("presentation_outline") is not presentation_outline:
+            self.session.state["presentation_outline"] = presentation_outline
         # Invalidate cache when outline is updated
         self.serialization_manager.invalidate("presentation_outline")
         
         if self.save_intermediate:
-            save_json_output(presentation_outline, str(self.output_dir / PRESENTATION_OUTLINE_FILE))
+            await save_json_outputs_async([(presentation_outline, str(self.output_dir / PRESENTATION_OUTLINE_FILE))])
             print(f"✅ Presentation outline saved")
         
         result = {"presentation_outline": presentation_outline}
@@ -180,7 +201,7 @@ class OutlineGenerationHandler:
         # Build previous outline note if provided (for retry)
         previous_outline_note = ""
         if previous_outline:
-            serialized_previous_outline = self.serialization_service.serialize(previous_outline, pretty=False)
+            serialized_previous_outline = self._serialize_outline(previous_outline)
             previous_outline_note = f"\n\n[PREVIOUS_OUTLINE]\nThe following outline was previously generated but needs improvement:\n{serialized_previous_outline}\n[END_PREVIOUS_OUTLINE]\n"
         
         # Build critic feedback note if provided
@@ -213,6 +234,7 @@ class OutlineGenerationHandler:
             "presentation_outline",
             parse_json=True
         )
+        self._last_outline_message = message
         
         if not presentation_outline:
             raise AgentExecutionError(
@@ -243,47 +265,40 @@ class OutlineGenerationHandler:
         self.obs_logger.start_agent_execution("OutlineCriticAgent", output_key="critic_review_outline")
         
         try:
-            # Serialize outline for critic
-            serialized_outline = self.serialization_service.serialize(presentation_outline, pretty=False)
-            
-            # Get original report content (not extracted knowledge) for validation
-            # The critic should evaluate against the source material to ensure completeness
-            report_content = self.config.report_content
-            if not report_content:
-                # Fallback to report_knowledge if original content not available
-                logger.warning("⚠️  Original report content not available, using report_knowledge for critic evaluation")
-                report_content = self.serialization_manager.get_serialized_report_knowledge(pretty=False)
-                report_section = f"[REPORT_KNOWLEDGE]\n{report_content}\n[END_REPORT_KNOWLEDGE]"
+            # Cheap local check first: a structurally broken outline is rejected
+            # without spending a critic LLM call on it
+            structure_issues = _find_outline_structure_issues(presentation_outline)
+            if structure_issues:
+                print(f"⚠️  Outline failed local structure check ({len(structure_issues)} issue(s)) - skipping critic LLM call")
+                critic_review = _build_structure_rejection_review(structure_issues)
+            elif OUTLINE_FAST_ACCEPT and self._passes_fast_check(presentation_outline):
+                print("⚡ Outline passed local fast check - skipping critic LLM call")
+                critic_review = _build_fast_accept_review()
             else:
-                report_section = f"[REPORT_CONTENT]\n{report_content}\n[END_REPORT_CONTENT]"
-            
-            critic_review = await self.executor.run_agent(
-                self.agent_registry.get("outline_critic"),
-                f"[PRESENTATION_OUTLINE]\n{serialized_outline}\n[END_PRESENTATION_OUTLINE]\n\n{report_section}\n\nEvaluate the presentation outline quality.",
-                "critic_review_outline",
-                parse_json=True
-            )
+                critic_review = await self._run_outline_critic(presentation_outline)
             
             if critic_review:
                 self.outputs["critic_review_outline"] = critic_review
                 self.session.state["critic_review_outline"] = critic_review
                 
                 # Log the evaluation result
-                quality_score = critic_review.get("overall_quality_score", "N/A")
+                quality_score = critic_review.get("overall_quality_score")
+                # No score means no critic ran (accepted by the local fast check)
+                score_text = f"{quality_score}/100" if quality_score is not None else "skipped (fast check)"
                 is_acceptable = critic_review.get("is_acceptable", False)
                 evaluation_notes = critic_review.get("evaluation_notes", "")
                 
-                print(f"📊 Outline Quality Score: {quality_score}/100")
+                print(f"📊 Outline Quality Score: {score_text}")
                 print(f"✅ Acceptable: {is_acceptable}")
                 if evaluation_notes:
                     print(f"📝 Evaluation: {evaluation_notes}")
                 
                 # Save critic review if intermediate saving is enabled
                 if self.save_intermediate:
-                    save_json_output(critic_review, str(self.output_dir / "outline_review.json"))
+                    await save_json_outputs_async([(critic_review, str(self.output_dir / OUTLINE_REVIEW_FILE))])
                     print(f"✅ Outline evaluation saved")
                 
-                self.obs_logger.finish_agent_execution(AgentStatus.SUCCESS, f"Quality score: {quality_score}, Acceptable: {is_acceptable}")
+                self.obs_logger.finish_agent_execution(AgentStatus.SUCCESS, f"Quality score: {score_text}, Acceptable: {is_acceptable}")
                 return critic_review
             else:
                 self.obs_logger.finish_agent_execution(AgentStatus.FAILED, "Critic returned empty result", has_output=False)
@@ -296,4 +311,159 @@ class OutlineGenerationHandler:
             print(f"⚠️  Outline evaluation failed: {e}")
             log_agent_error(logger, e, "OutlineCriticAgent")
             return None
+    
+    def _discard_rejected_outline(self) -> None:
+        """
+        Drop a rejected outline from the response cache (if the outline generator is cached),
+        so later runs with the same input regenerate it instead of replaying it.
+        """
+        if self._last_outline_message is not None:
+            self.executor.discard_cached_response(
+                self.agent_registry.get("outline_generator"),
+                self._last_outline_message
+            )
+    
+    def _serialize_outline(self, presentation_outline: Dict[str, Any]) -> str:
+        """
+        Serialize an outline compactly, reusing the last result for the same object.
+        
+        The critic and the critic-feedback retry both embed the same outline.
+        
+        Args:
+            presentation_outline: The outline to serialize
+        
+        Returns:
+            Compact JSON string
+        """
+        cached = self._last_serialized_outline
+        if cached is not None and cached[0] is presentation_outline:
+            return cached[1]
+        serialized = self.serialization_service.serialize(presentation_outline, pretty=False)
+        self._last_serialized_outline = (presentation_outline, serialized)
+        return serialized
+    
+    def _passes_fast_check(self, presentation_outline: Dict[str, Any]) -> bool:
+        """
+        Check whether every figure cited in the outline appears verbatim in the report knowledge.
+        
+        This is a cheap hallucination proxy: an outline that only cites numbers the report
+        contains is accepted without the critic; anything uncertain goes to the critic.
+        
+        Args:
+            presentation_outline: Structurally valid outline to check
+        
+        Returns:
+            True if no cited figure is missing from the report knowledge
+        """
+        serialized_report_knowledge = self.serialization_manager.get_serialized_report_knowledge(pretty=False)
+        for slide in presentation_outline["slides"]:
+            texts = [slide.get("title", "")]
+            texts.extend(point for point in slide.get("key_points", []) if isinstance(point, str))
+            for text in texts:
+                for figure in _FIGURE_RE.findall(text):
+                    if figure not in serialized_report_knowledge:
+                        logger.debug(f"Fast check: figure '{figure}' on slide {slide.get('slide_number')} not found in report knowledge")
+                        return False
+        return True
+    
+    async def _run_outline_critic(self, presentation_outline: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run the outline critic agent.
+        
+        Args:
+            presentation_outline: The outline to evaluate
+        
+        Returns:
+            Critic review dictionary, or None if the critic returned nothing
+        """
+        # Serialize outline for critic (reused if this outline is later sent back for a retry)
+        serialized_outline = self._serialize_outline(presentation_outline)
+        
+        # Get original report content (not extracted knowledge) for validation
+        # The critic should evaluate against the source material to ensure completeness
+        report_content = self.config.report_content
+        if not report_content:
+            # Fallback to report_knowledge if original content not available
+            logger.warning("⚠️  Original report content not available, using report_knowledge for critic evaluation")
+            report_content = self.serialization_manager.get_serialized_report_knowledge(pretty=False)
+            report_section = f"[REPORT_KNOWLEDGE]\n{report_content}\n[END_REPORT_KNOWLEDGE]"
+        else:
+            report_section = f"[REPORT_CONTENT]\n{report_content}\n[END_REPORT_CONTENT]"
+        
+        return await self.executor.run_agent(
+            self.agent_registry.get("outline_critic"),
+            # Report first, outline last: the report is identical across the initial and
+            # retry evaluations, so it forms a stable prefix for Gemini's implicit cache
+            f"{report_section}\n\n[PRESENTATION_OUTLINE]\n{serialized_outline}\n[END_PRESENTATION_OUTLINE]\n\nEvaluate the presentation outline quality.",
+            "critic_review_outline",
+            parse_json=True
+        )
+
+
+def _find_outline_structure_issues(presentation_outline: Any) -> List[str]:
+    """
+    Check that an outline has the structure downstream steps rely on.
+    
+    Args:
+        presentation_outline: Outline produced by the outline generator
+    
+    Returns:
+        List of structural problems (empty if the outline looks well-formed)
+    """
+    if not isinstance(presentation_outline, dict):
+        return [f"Outline is not a JSON object (got {type(presentation_outline).__name__})"]
+    
+    slides = presentation_outline.get("slides")
+    if not isinstance(slides, list) or not slides:
+        return ["Outline has no 'slides' list or the list is empty"]
+    
+    issues = []
+    for index, slide in enumerate(slides, start=1):
+        if not isinstance(slide, dict):
+            issues.append(f"Slide entry {index} is not a JSON object")
+            continue
+        missing = [key for key in _REQUIRED_OUTLINE_SLIDE_KEYS if not slide.get(key)]
+        if missing:
+            issues.append(f"Slide {slide.get('slide_number', index)} is missing: {', '.join(missing)}")
+    return issues
+
+
+def _build_structure_rejection_review(structure_issues: List[str]) -> Dict[str, Any]:
+    """
+    Build a critic-shaped review for an outline rejected by the local structure check.
+    
+    Args:
+        structure_issues: Problems found by _find_outline_structure_issues
+    
+    Returns:
+        Review dictionary with the same keys as the critic agent's output
+    """
+    return {
+        "overall_quality_score": 0,
+        "is_acceptable": False,
+        "strengths": [],
+        "weaknesses": structure_issues,
+        "recommendations": [
+            "Return a complete outline JSON with a non-empty 'slides' list; "
+            f"every slide needs {', '.join(_REQUIRED_OUTLINE_SLIDE_KEYS)}."
+        ],
+        "evaluation_notes": "Rejected by local structure check before critic evaluation.",
+    }
 
+
+def _build_fast_accept_review() -> Dict[str, Any]:
+    """
+    Build a critic-shaped review for an outline accepted by the local fast check.
+    
+    No quality score is included because no evaluation model was run.
+    
+    Returns:
+        Review dictionary with the critic agent's acceptance keys
+    """
+    return {
+        "is_acceptable": True,
+        "strengths": ["All figures cited in the outline appear in the report knowledge."],
+        "weaknesses": [],
+        "recommendations": [],
+        "evaluation_notes": "Accepted by local fast check (OUTLINE_FAST_ACCEPT) without critic evaluation.",
+    }
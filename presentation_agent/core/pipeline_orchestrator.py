@@ -2,7 +2,6 @@
 Pipeline orchestrator - coordinates all agents in the presentation generation pipeline.
 """
 
-import json
 import logging
 import asyncio
 from pathlib import Path
@@ -17,12 +16,19 @@ from config import (
     OUTPUT_DIR,
     TRACE_HISTORY_FILE,
     OBSERVABILITY_LOG_FILE,
+    COMPRESS_TRACE_HISTORY,
     REPORT_KNOWLEDGE_FILE,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_AGENTS,
+    PDF_CACHE_ENABLED,
+    PDF_CACHE_DIR,
+    PDF_CACHE_TTL_SECONDS,
 )
 from presentation_agent.core.agent_registry import AgentRegistry, create_default_agent_registry
-from presentation_agent.utils.pdf_loader import load_pdf
-from presentation_agent.utils.helpers import save_json_output, is_valid_chart_data
-from presentation_agent.utils.observability import get_observability_logger, AgentStatus
+from presentation_agent.utils.pdf_loader import load_pdf, load_pdf_from_url_cached
+from presentation_agent.utils.helpers import save_json_outputs_async
+from presentation_agent.utils.observability import get_observability_logger, AgentStatus, ObservabilityLogger
 from presentation_agent.core.agent_executor import AgentExecutor
 from presentation_agent.core.json_parser import parse_json_robust
 from presentation_agent.core.exceptions import AgentExecutionError, JSONParseError, AgentOutputError
@@ -34,6 +40,8 @@ from presentation_agent.core.slide_generation_handler import SlideGenerationHand
 from presentation_agent.core.outline_generation_handler import OutlineGenerationHandler
 from presentation_agent.core.web_slides_generation_handler import WebSlidesGenerationHandler
 from presentation_agent.core.context_builder import ContextBuilder
+from presentation_agent.core.stage_graph import StageGraph
+from presentation_agent.core.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -50,23 +58,29 @@ class PipelineOrchestrator:
         include_critics: bool = True,
         save_intermediate: bool = True,
         open_browser: bool = True,
-        agent_registry: Optional[AgentRegistry] = None
+        agent_registry: Optional[AgentRegistry] = None,
+        obs_logger: Optional[ObservabilityLogger] = None,
+        reset_image_cache: bool = True
     ):
         self.config = config
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.include_critics = include_critics
         self.save_intermediate = save_intermediate
         self.open_browser = open_browser
+        # The image usage tracker and persistent image cache are process-wide;
+        # concurrent runs reset them once up front instead of per pipeline
+        self.reset_image_cache = reset_image_cache
         
         # Initialize agent registry (dependency injection)
         self.agent_registry = agent_registry or create_default_agent_registry()
         
-        # Initialize observability
+        # Initialize observability (a dedicated logger can be injected for concurrent runs)
         trace_file = str(self.output_dir / TRACE_HISTORY_FILE)
-        self.obs_logger = get_observability_logger(
+        self.obs_logger = obs_logger or get_observability_logger(
             log_file=str(self.output_dir / OBSERVABILITY_LOG_FILE),
-            trace_file=trace_file
+            trace_file=trace_file,
+            compress_trace=COMPRESS_TRACE_HISTORY
         )
         
         # Initialize session
@@ -76,6 +90,8 @@ class PipelineOrchestrator:
         
         # Pipeline outputs
         self.outputs: Dict[str, Any] = {}
+        self.stage_graph: Optional[StageGraph] = None
+        self._report_load_task: Optional[asyncio.Task] = None
         
         # Initialize services (following SRP)
         self.serialization_service = SerializationService()
@@ -85,6 +101,7 @@ class PipelineOrchestrator:
             cache_manager=self.cache_manager,
             outputs=self.outputs
         )
+        self.response_cache = ResponseCache(Path(RESPONSE_CACHE_DIR), enabled=RESPONSE_CACHE_ENABLED)
     
     async def initialize(self):
         """Initialize session and executor."""
@@ -92,12 +109,17 @@ class PipelineOrchestrator:
             app_name=APP_NAME,
             user_id=USER_ID
         )
-        self.executor = AgentExecutor(self.session)
+        self.executor = AgentExecutor(
+            self.session,
+            response_cache=self.response_cache,
+            cacheable_agents=RESPONSE_CACHE_AGENTS
+        )
         self.obs_logger.start_pipeline("presentation_pipeline")
         
         # Clear image cache at the start of each pipeline run (async)
-        from presentation_agent.utils.image_helper import clear_image_cache_async
-        await clear_image_cache_async()
+        if self.reset_image_cache:
+            from presentation_agent.utils.image_helper import clear_image_cache_async
+            await clear_image_cache_async()
     
     async def run(self) -> Dict[str, Any]:
         """
@@ -106,66 +128,30 @@ class PipelineOrchestrator:
         Returns:
             Dictionary with all generated outputs
         """
-        await self.initialize()
+        # Start the PDF download/parse now so it overlaps with session setup
+        if self.config.report_url and not self.config.report_content:
+            self._report_load_task = asyncio.create_task(self._load_report_content())
         
         try:
-            # Step 1: Report Understanding
-            await self._step_report_understanding()
-            
-            # Step 2: Outline Generation with Critic
-            outline_handler = OutlineGenerationHandler(
-                config=self.config,
-                executor=self.executor,
-                agent_registry=self.agent_registry,
-                obs_logger=self.obs_logger,
-                serialization_service=self.serialization_service,
-                serialization_manager=self.serialization_manager,
-                outputs=self.outputs,
-                output_dir=self.output_dir,
-                save_intermediate=self.save_intermediate,
-            )
-            outline_result = await outline_handler.execute(
-                report_knowledge=self.outputs["report_knowledge"],
-                session=self.session
-            )
-            # Results already stored in self.outputs by handler
-            
-            # Step 3: Slide and Script Generation
-            handler = SlideGenerationHandler(
-                config=self.config,
-                executor=self.executor,
-                agent_registry=self.agent_registry,
-                obs_logger=self.obs_logger,
-                serialization_service=self.serialization_service,
-                serialization_manager=self.serialization_manager,
-                build_selective_context_fn=ContextBuilder.build_selective_context,
-                outputs=self.outputs,
-                output_dir=self.output_dir,
-                save_intermediate=self.save_intermediate,
-            )
-            result = await handler.execute(
-                presentation_outline=self.outputs["presentation_outline"],
-                report_knowledge=self.outputs["report_knowledge"]
-            )
-            # Store in session state
-            self.session.state["slide_deck"] = result["slide_deck"]
-            self.session.state["presentation_script"] = result["presentation_script"]
-            
-            # Step 3.5: Parallel Chart and Image Generation (OPTIMIZATION)
-            # Generate charts and images in parallel to save time
-            image_cache, keyword_usage_tracker = await self._step_parallel_chart_and_image_generation()
-            
-            # Step 4: Web Slides Generation
-            web_slides_handler = WebSlidesGenerationHandler(
-                config=self.config,
-                obs_logger=self.obs_logger,
-                outputs=self.outputs,
-                output_dir=self.output_dir,
-                session=self.session,
-                save_intermediate=self.save_intermediate,
-                open_browser=self.open_browser,
+            await self.initialize()
+        except BaseException:
+            if self._report_load_task is not None:
+                self._report_load_task.cancel()
+            raise
+        
+        try:
+            # Build the stage DAG: charts and images only depend on the slide deck,
+            # so they share a topological layer and run concurrently
+            self.stage_graph = (
+                StageGraph()
+                .add_stage("report_understanding", self._step_report_understanding)
+                .add_stage("outline", self._step_outline_generation, depends_on=("report_understanding",))
+                .add_stage("slides", self._step_slide_generation, depends_on=("outline",))
+                .add_stage("charts", self._step_chart_generation, depends_on=("slides",))
+                .add_stage("images", self._step_image_pre_generation, depends_on=("slides",))
+                .add_stage("web_slides", self._step_web_slides_generation, depends_on=("charts", "images"))
             )
-            await web_slides_handler.execute(image_cache, keyword_usage_tracker)
+            await self.stage_graph.run()
             
             print("\n✅ Pipeline completed - web slides generated!")
             
@@ -216,37 +202,37 @@ class PipelineOrchestrator:
             raise
     
     
+    async def _load_report_content(self):
+        """Load the report PDF from config.report_url off the event loop."""
+        print(f"📄 Loading PDF from URL: {self.config.report_url}")
+        if PDF_CACHE_ENABLED:
+            self.config.report_content = await asyncio.to_thread(
+                load_pdf_from_url_cached, self.config.report_url, PDF_CACHE_DIR, PDF_CACHE_TTL_SECONDS
+            )
+        else:
+            self.config.report_content = await asyncio.to_thread(load_pdf, report_url=self.config.report_url)
+        lines = self.config.report_content.split('\n')
+        words = self.config.report_content.split()
+        print(f"✅ Loaded PDF: {len(self.config.report_content)} characters, {len(lines)} lines, {len(words)} words")
+    
     async def _step_report_understanding(self):
         """Step 1: Report Understanding Agent."""
         print("\n📊 Step 1: Report Understanding Agent")
         self.obs_logger.start_agent_execution("ReportUnderstandingAgent", output_key="report_knowledge")
         
-        # Load PDF if needed
-        if self.config.report_url and not self.config.report_content:
-            print(f"📄 Loading PDF from URL: {self.config.report_url}")
-            self.config.report_content = load_pdf(report_url=self.config.report_url)
-            lines = self.config.report_content.split('\n')
-            words = self.config.report_content.split()
-            print(f"✅ Loaded PDF: {len(self.config.report_content)} characters, {len(lines)} lines, {len(words)} words")
+        # Load PDF if needed (normally already started by run())
+        if self._report_load_task is not None:
+            await self._report_load_task
+        elif self.config.report_url and not self.config.report_content:
+            await self._load_report_content()
         
         # Build initial message
         scenario_provided = bool(self.config.scenario and self.config.scenario.strip())
-        target_audience_provided = self.config.target_audience is not None
-        
-        scenario_section = (
-            f"[SCENARIO]\n{self.config.scenario}\n\n"
-            if scenario_provided
-            else "[SCENARIO]\nN/A (Please infer from report content)\n\n"
-        )
-        target_audience_section = (
-            f"[TARGET_AUDIENCE]\n{self.config.target_audience}\n\n"
-            if target_audience_provided
-            else "[TARGET_AUDIENCE]\nN/A (Please infer from scenario and report content)\n\n"
-        )
-        custom_instruction_section = (
-            f"[CUSTOM_INSTRUCTION]\n{self.config.custom_instruction}\n\n"
-            if self.config.custom_instruction and self.config.custom_instruction.strip()
-            else ""
+        target_audience_provided = bool(self.config.target_audience and self.config.target_audience.strip())
+        scenario_section, target_audience_section, custom_instruction_section = ContextBuilder.build_config_sections(
+            self.config,
+            scenario_fallback="N/A (Please infer from report content)",
+            target_audience_fallback="N/A (Please infer from scenario and report content)",
         )
         
         initial_message = f"""[REPORT_CONTENT]
@@ -273,15 +259,72 @@ class PipelineOrchestrator:
         self._log_inference_results(report_knowledge, scenario_provided, target_audience_provided)
         
         self.outputs["report_knowledge"] = report_knowledge
-        self.session.state["report_knowledge"] = report_knowledge
+        self._set_state("report_knowledge", report_knowledge)
         # Invalidate cache when report_knowledge is updated
         self.serialization_manager.invalidate("report_knowledge")
         self.obs_logger.finish_agent_execution(AgentStatus.SUCCESS, has_output=True)
         
         if self.save_intermediate:
-            save_json_output(report_knowledge, str(self.output_dir / REPORT_KNOWLEDGE_FILE))
+            await save_json_outputs_async([(report_knowledge, str(self.output_dir / REPORT_KNOWLEDGE_FILE))])
             print(f"✅ Report knowledge saved")
     
+    async def _step_outline_generation(self):
+        """Step 2: Outline Generation with Critic."""
+        outline_handler = OutlineGenerationHandler(
+            config=self.config,
+            executor=self.executor,
+            agent_registry=self.agent_registry,
+            obs_logger=self.obs_logger,
+            serialization_service=self.serialization_service,
+            serialization_manager=self.serialization_manager,
+            outputs=self.outputs,
+            output_dir=self.output_dir,
+            save_intermediate=self.save_intermediate,
+            include_critics=self.include_critics,
+        )
+        # Results are stored in self.outputs by the handler
+        return await outline_handler.execute(
+            report_knowledge=self.outputs["report_knowledge"],
+            session=self.session
+        )
+    
+    async def _step_slide_generation(self):
+        """Step 3: Slide and Script Generation."""
+        handler = SlideGenerationHandler(
+            config=self.config,
+            executor=self.executor,
+            agent_registry=self.agent_registry,
+            obs_logger=self.obs_logger,
+            serialization_service=self.serialization_service,
+            serialization_manager=self.serialization_manager,
+            build_selective_context_fn=ContextBuilder.build_selective_context,
+            outputs=self.outputs,
+            output_dir=self.output_dir,
+            save_intermediate=self.save_intermediate,
+        )
+        result = await handler.execute(
+            presentation_outline=self.outputs["presentation_outline"],
+            report_knowledge=self.outputs["report_knowledge"]
+        )
+        # Store in session state
+        self._set_state("slide_deck", result["slide_deck"])
+        self._set_state("presentation_script", result["presentation_script"])
+        return result
+    
+    def _set_state(self, key: str, value: Any):
+        """
+        Store a value in session.state, skipping writes of the identical object.
+        
+        Every session.state assignment is recorded as a state delta, so
+        idempotent writes (e.g. a slide deck mutated in place) are skipped.
+        
+        Args:
+            key: State key
+            value: Value to store (shared by reference, not copied)
+        """
+        if self.session.state.get(key) is not value:
+            self.session.state[key] = value
+    
     def _log_inference_results(self, report_knowledge: Dict, scenario_provided: bool, target_audience_provided: bool):
         """Log inference results for scenario and target_audience."""
         print("\n🔍 Inference Results:")
@@ -328,109 +371,124 @@ class PipelineOrchestrator:
         if slides_with_charts:
             print(f"   📊 Found {len(slides_with_charts)} slide(s) needing charts: {slides_with_charts}")
             
-            chart_input = json.dumps({"slide_deck": slide_deck}, separators=(',', ':'))
+            # Charts are rendered straight from chart_spec; no LLM round-trip needed
+            from presentation_agent.agents.chart_generator_agent.agent import generate_deck_charts
             try:
-                chart_status = await self.executor.run_agent(
-                    self.agent_registry.get("chart_generator"),
-                    chart_input,
-                    "chart_generation_status",
-                    parse_json=False
+                charts_generated_count, charts_failed_count = await asyncio.to_thread(
+                    generate_deck_charts, slide_deck
                 )
-            except AgentExecutionError as e:
+            except Exception as e:
                 self.obs_logger.finish_agent_execution(AgentStatus.FAILED, str(e), has_output=False)
-                raise
-            
-            # Get updated slide_deck from session.state
-            updated_slide_deck = self.session.state.get("slide_deck") or slide_deck
-            
-            # Verify charts were generated
-            charts_generated_count = 0
-            for slide in updated_slide_deck.get('slides', []):
-                visual_elements = slide.get('visual_elements', {})
-                chart_data = visual_elements.get('chart_data')
-                if is_valid_chart_data(chart_data):
-                    charts_generated_count += 1
+                raise AgentExecutionError(f"Chart generation failed: {e}", agent_name="ChartGeneratorAgent") from e
             
             if charts_generated_count > 0:
                 print(f"   ✅ Successfully generated {charts_generated_count} chart(s)")
-                slide_deck = updated_slide_deck
-                self.outputs["slide_deck"] = slide_deck
-                self.session.state["slide_deck"] = slide_deck
+            if charts_failed_count > 0:
+                print(f"   ⚠️  {charts_failed_count} chart(s) failed to generate")
+            # Charts are written into slide_deck in place, so this is usually a no-op
+            self._set_state("slide_deck", slide_deck)
             
             self.obs_logger.finish_agent_execution(AgentStatus.SUCCESS, has_output=True)
         else:
             print("   ℹ️  No charts needed for this presentation")
             self.obs_logger.finish_agent_execution(AgentStatus.SKIPPED, "No charts needed", has_output=False)
     
-    async def _step_parallel_chart_and_image_generation(self) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    async def _step_image_pre_generation(self) -> Tuple[Dict[str, Any], Dict[str, int]]:
         """
-        Step 3.5: Generate charts and images in parallel (OPTIMIZATION).
+        Step 3.5: Image pre-generation.
         
-        This method demonstrates parallel processing by running chart generation and
-        image pre-generation simultaneously using asyncio.gather(). This significantly
-        reduces total execution time compared to sequential execution.
-        
-        Implementation:
-        - Uses asyncio.gather() to run both tasks concurrently
-        - Chart generation uses ChartGeneratorAgent (LLM-based) with generate_chart_tool
-        - Image pre-generation uses pre_generate_images utility (tool-based)
-        - Both tasks are independent and can run simultaneously
-        
-        Design:
-        - Parallel execution reduces total pipeline time (performance optimization)
-        - Both tasks write to session.state independently
-        - Returns image_cache and keyword_usage_tracker for web slides generation
-        - Handles cases where charts may not be needed (skips chart generation)
-        
-        Behavior:
-        - Always pre-generates images (required for web slides)
-        - Conditionally generates charts only if slides require them
-        - If charts needed: runs both tasks in parallel
-        - If no charts needed: only runs image pre-generation
-        - Returns cached results for downstream web slides generation
+        Runs in the same stage-graph layer as chart generation, so images are
+        generated while the charts are rendering.
         
         Returns:
             Tuple of (image_cache, keyword_usage_tracker) for use in web slides generation
         """
-        print("\n⚡ Step 3.5: Parallel Chart and Image Generation")
-        
         slide_deck = self.outputs.get("slide_deck")
         if not slide_deck:
-            print("   ℹ️  No slide deck available")
+            print("   ℹ️  No slide deck available for image pre-generation")
             return {}, {}
         
-        # Check if charts are needed (some presentations may not require charts)
-        slides_with_charts = []
-        for slide in slide_deck.get('slides', []):
-            visual_elements = slide.get('visual_elements', {})
-            if visual_elements.get('charts_needed', False) and visual_elements.get('chart_spec'):
-                slides_with_charts.append(slide.get('slide_number'))
-        
-        # Pre-generate images (always needed for web slides, regardless of charts)
         from presentation_agent.tools.web_slides_generator import pre_generate_images
         print("   🖼️  Pre-generating images...")
-        
-        # Run chart generation and image pre-generation in parallel using asyncio.gather()
-        # This optimization reduces total execution time by running independent tasks concurrently
-        if slides_with_charts:
-            print(f"   📊 Found {len(slides_with_charts)} slide(s) needing charts: {slides_with_charts}")
-            # Run both in parallel: chart generation (async) and image pre-generation (sync, wrapped in thread)
-            chart_task = self._step_chart_generation()
-            image_task = asyncio.to_thread(pre_generate_images, slide_deck)
-            
-            # Wait for both to complete in parallel
-            _, image_result = await asyncio.gather(chart_task, image_task)
-            image_cache, keyword_usage_tracker = image_result
-        else:
-            print("   ℹ️  No charts needed for this presentation")
-            # Only pre-generate images
-            image_cache, keyword_usage_tracker = await asyncio.to_thread(pre_generate_images, slide_deck)
-        
-        # Get updated slide_deck from session.state (may have been updated by ChartGeneratorAgent)
-        updated_slide_deck = self.session.state.get("slide_deck") or slide_deck
-        if updated_slide_deck != slide_deck:
-            self.outputs["slide_deck"] = updated_slide_deck
-        
-        print(f"   ✅ Parallel generation complete: {len(image_cache)} image keywords cached")
+        image_cache, keyword_usage_tracker = await asyncio.to_thread(pre_generate_images, slide_deck)
+        print(f"   ✅ Image pre-generation complete: {len(image_cache)} image keywords cached")
         return image_cache, keyword_usage_tracker
     
+    async def _step_web_slides_generation(self):
+        """Step 4: Web Slides Generation."""
+        image_cache, keyword_usage_tracker = self.stage_graph.results.get("images") or ({}, {})
+        web_slides_handler = WebSlidesGenerationHandler(
+            config=self.config,
+            obs_logger=self.obs_logger,
+            outputs=self.outputs,
+            output_dir=self.output_dir,
+            session=self.session,
+            save_intermediate=self.save_intermediate,
+            open_browser=self.open_browser,
+        )
+        await web_slides_handler.execute(image_cache, keyword_usage_tracker)
+
+
+async def run_pipelines_concurrently(
+    configs: List[PresentationConfig],
+    output_dirs: List[str],
+    max_concurrency: int = 3,
+    **orchestrator_kwargs: Any
+) -> List[Dict[str, Any]]:
+    """
+    Run several presentation pipelines concurrently.
+    
+    LLM calls dominate pipeline time and are I/O-bound, so overlapping up to
+    max_concurrency pipelines multiplies throughput for bulk generation.
+    Each pipeline gets its own output directory and observability trace.
+    
+    The image cache (image_helper's persistent cache and per-run usage tracker)
+    is module-level state, so it is reset once before the batch and shared by
+    all pipelines in it: a keyword still gets a different image each time it is
+    used, across the whole batch rather than per pipeline.
+    
+    Args:
+        configs: Presentation configs, one per pipeline
+        output_dirs: Output directory per pipeline (must be distinct)
+        max_concurrency: Maximum number of pipelines running at once
+        **orchestrator_kwargs: Extra PipelineOrchestrator arguments (e.g., open_browser=False)
+    
+    Returns:
+        Pipeline outputs in the same order as configs
+    
+    Raises:
+        ValueError: If configs and output_dirs differ in length or output_dirs repeat
+    """
+    if len(configs) != len(output_dirs):
+        raise ValueError(f"Got {len(configs)} configs but {len(output_dirs)} output directories")
+    if len(set(output_dirs)) != len(output_dirs):
+        raise ValueError("Each concurrent pipeline needs its own output directory")
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _run_one(config: PresentationConfig, output_dir: str) -> Dict[str, Any]:
+        async with semaphore:
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            orchestrator = PipelineOrchestrator(
+                config,
+                output_dir=output_dir,
+                obs_logger=ObservabilityLogger(
+                    log_file=str(output_path / OBSERVABILITY_LOG_FILE),
+                    trace_file=str(output_path / TRACE_HISTORY_FILE),
+                    compress_trace=COMPRESS_TRACE_HISTORY
+                ),
+                reset_image_cache=False,
+                **orchestrator_kwargs
+            )
+            return await orchestrator.run()
+    
+    # Reset the shared image cache once; per-pipeline resets would clear the
+    # usage tracker and reload the cache under pipelines still generating images
+    from presentation_agent.utils.image_helper import clear_image_cache_async
+    await clear_image_cache_async()
+    
+    print(f"\n🚀 Running {len(configs)} pipeline(s) with max concurrency {max_concurrency}")
+    return await asyncio.gather(*(
+        _run_one(config, output_dir) for config, output_dir in zip(configs, output_dirs)
+    ))
@@ -0,0 +1,134 @@
+"""
+Response cache - exact-match disk cache for replayable agent outputs.
+Extracted from PipelineOrchestrator to follow Single Responsibility Principle.
+"""
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=32)
+def instruction_fingerprint(instruction: str) -> str:
+    """
+    Hash an agent instruction once.
+    
+    Instructions are static per process, so the (multi-KB) string is only
+    hashed the first time it is seen.
+    
+    Args:
+        instruction: Agent instruction text
+    
+    Returns:
+        Short hex digest of the instruction
+    """
+    return hashlib.blake2b(instruction.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    Caches parsed agent outputs on disk, keyed by a hash of the agent name and
+    the exact input message, prefixed with the agent instruction fingerprint
+    so editing an instruction invalidates its cached responses.
+    
+    A hit skips the LLM call entirely, which makes re-running the pipeline on
+    the same report (same scenario, audience, duration and instructions) free
+    for the cached steps.
+    """
+    
+    def __init__(self, cache_dir: Path, enabled: bool = True):
+        """
+        Initialize response cache.
+        
+        Args:
+            cache_dir: Directory holding one JSON file per cached response
+            enabled: If False, get() always misses and set() is a no-op
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def make_key(agent_name: str, message: str, instruction: str = "") -> str:
+        """
+        Build the cache key for an agent input.
+        
+        Args:
+            agent_name: Name of the agent producing the output
+            message: Exact input message sent to the agent
+            instruction: Agent instruction text (its fingerprint prefixes the key)
+        
+        Returns:
+            Key identifying the (instruction, agent, message) triple
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(agent_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(message.encode("utf-8"))
+        return f"{instruction_fingerprint(instruction)}_{digest.hexdigest()}"
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached response.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Cached value, or None on miss (or if the cache is disabled)
+        """
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable response cache entry {path.name}: {e}")
+            return None
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable agent output
+        """
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False, separators=(",", ":"))
+            tmp_path.replace(path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"⚠️  Could not write response cache entry {path.name}: {e}")
+    
+    def delete(self, key: str) -> None:
+        """
+        Drop a cached response (e.g. one that later failed validation).
+        
+        Args:
+            key: Cache key from make_key()
+        """
+        if not self.enabled:
+            return
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"⚠️  Could not delete response cache entry {key}: {e}")
@@ -2,12 +2,28 @@
 Serialization manager - manages serialization and caching of pipeline outputs.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from presentation_agent.core.serialization_service import SerializationService
 from presentation_agent.core.cache_manager import CacheManager
 
 
+@lru_cache(maxsize=None)
+def _cache_key(key: str, pretty: bool) -> str:
+    """
+    Build the cache key for a serialized output (computed once per key/format pair).
+    
+    Args:
+        key: Output key (e.g., 'report_knowledge')
+        pretty: Whether the pretty or compact format is cached
+    
+    Returns:
+        Cache key string, prefixed by the output key so invalidate(key) matches it
+    """
+    return f"{key}_{'pretty' if pretty else 'compact'}"
+
+
 class SerializationManager:
     """
     Manages serialization and caching of pipeline outputs.
@@ -58,9 +74,10 @@ class SerializationManager:
         Raises:
             ValueError: If key not available in outputs
         """
-        cache_key = f"{key}_{'pretty' if pretty else 'compact'}"
+        cache_key = _cache_key(key, pretty)
         
-        if not self.cache_manager.has(cache_key):
+        serialized = self.cache_manager.get(cache_key)
+        if serialized is None:
             data = self.outputs.get(key)
             if data is None:
                 raise ValueError(f"{key} not available in outputs")
@@ -68,7 +85,7 @@ class SerializationManager:
             serialized = self.serialization_service.serialize(data, pretty=pretty)
             self.cache_manager.set(cache_key, serialized)
         
-        return self.cache_manager.get(cache_key)
+        return serialized
     
     def invalidate(self, key: Optional[str] = None):
         """
@@ -6,10 +6,28 @@ Extracted from PipelineOrchestrator to follow Single Responsibility Principle.
 import json
 from typing import Any, Dict
 
+# orjson is optional: 2-5x faster on large dicts such as report_knowledge.
+# It is not a drop-in match for the stdlib json module:
+# - floats are formatted differently (1e20 vs 1e+20)
+# - NaN/Infinity are written as null
+# - integers beyond 64 bits raise on dump
+# - NaN/Infinity literals raise on load
+# The two raising cases fall back to json, so only the silent differences remain.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_PRETTY = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    _ORJSON_COMPACT = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 class SerializationService:
     """
     Handles JSON serialization with support for pretty and compact formats.
+    
+    Uses orjson when installed and falls back to the stdlib json module.
     """
     
     @staticmethod
@@ -25,6 +43,12 @@ class SerializationService:
         Returns:
             Serialized JSON string
         """
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(data, option=_ORJSON_PRETTY if pretty else _ORJSON_COMPACT).decode("utf-8")
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits, which json handles
+        
         if pretty:
             # Pretty format for logs/debugging
             return json.dumps(
@@ -51,5 +75,10 @@ class SerializationService:
         Returns:
             Deserialized Python object
         """
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(json_str)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity literals, which json accepts
         return json.loads(json_str)
 
@@ -13,16 +13,29 @@ from config import (
     SLIDE_DECK_FILE,
     PRESENTATION_SCRIPT_FILE,
 )
-from presentation_agent.utils.helpers import save_json_output
+from presentation_agent.utils.helpers import save_json_outputs_async, preview_json
 from presentation_agent.utils.observability import AgentStatus
 from presentation_agent.core.agent_executor import AgentExecutor
-from presentation_agent.core.json_parser import parse_json_robust
+from presentation_agent.core.json_parser import parse_json_robust, parse_json_maybe_fenced
 from presentation_agent.core.exceptions import AgentExecutionError, JSONParseError, AgentOutputError
 from presentation_agent.core.logging_utils import log_agent_error
 from presentation_agent.core.serialization_manager import SerializationManager
 
 logger = logging.getLogger(__name__)
 
+# Lowercase markers in a JSONParseError message that mean the LLM produced malformed JSON (worth retrying)
+_JSON_SYNTAX_ERROR_INDICATORS = (
+    "expecting property name",
+    "expecting ',' delimiter",
+    "expecting ':' delimiter",
+    "invalid escape",
+    "expecting value",  # Often means no JSON at all
+    "failed to parse json",  # Generic parsing failure
+)
+
+# Lowercase markers of a plain-text error reply instead of JSON
+_PLAIN_TEXT_ERROR_MARKERS = ("unable", "error", "cannot")
+
 
 class SlideGenerationHandler:
     """
@@ -67,6 +80,60 @@ class SlideGenerationHandler:
         self.outputs = outputs
         self.output_dir = output_dir
         self.save_intermediate = save_intermediate
+        self._message: Optional[str] = None
+    
+    def _build_message(self, presentation_outline: Dict, report_knowledge: Dict) -> str:
+        """
+        Build the slide-and-script generation message (once per handler).
+        
+        The first attempt, the LLM retries and the fallback path all send the
+        same full message, so selective context extraction and serialization
+        run once and every attempt carries the same context.
+        
+        Args:
+            presentation_outline: The presentation outline
+            report_knowledge: The report knowledge
+        
+        Returns:
+            Message for the slide and script generator agent
+        """
+        if self._message is not None:
+            return self._message
+        
+        # Use cached serialization for performance
+        serialized_outline = self.serialization_manager.get_serialized_presentation_outline(pretty=False)
+        
+        # CONTEXT ENGINEERING: Use selective context extraction to reduce token usage
+        # Extract only relevant report sections based on slide topics
+        selective_report_knowledge = self.build_selective_context_fn(presentation_outline, report_knowledge)
+        
+        # Serialize the selective context (compact format for agent messages)
+        selective_report_knowledge_str = self.serialization_service.serialize(
+            selective_report_knowledge,
+            pretty=False
+        )
+        
+        # Build simple message with data - let agent's instructions.md handle interpretation
+        # The agent already has all the logic for custom instructions, duration, etc. in its instructions.md
+        message_parts = [
+            f"[PRESENTATION_OUTLINE]\n{serialized_outline}\n[END_PRESENTATION_OUTLINE]",
+            f"[REPORT_KNOWLEDGE]\n{selective_report_knowledge_str}\n[END_REPORT_KNOWLEDGE]",
+        ]
+        
+        # Add simple data fields (not elaborate prompts - agent's instructions.md handles interpretation)
+        if self.config.custom_instruction and self.config.custom_instruction.strip():
+            message_parts.append(f"[CUSTOM_INSTRUCTION]\n{self.config.custom_instruction}\n[END_CUSTOM_INSTRUCTION]")
+        
+        message_parts.append(f"[DURATION]\n{self.config.duration}\n[END_DURATION]")
+        
+        if self.config.scenario:
+            message_parts.append(f"[SCENARIO]\n{self.config.scenario}\n[END_SCENARIO]")
+        
+        if self.config.target_audience:
+            message_parts.append(f"[TARGET_AUDIENCE]\n{self.config.target_audience}\n[END_TARGET_AUDIENCE]")
+        
+        self._message = "\n\n".join(message_parts)
+        return self._message
     
     async def execute(
         self,
@@ -92,41 +159,9 @@ class SlideGenerationHandler:
         self.obs_logger.start_agent_execution("SlideAndScriptGeneratorAgent", output_key="slide_and_script")
         
         try:
-            # Use cached serialization for performance
-            serialized_outline = self.serialization_manager.get_serialized_presentation_outline(pretty=False)
-            
-            # CONTEXT ENGINEERING: Use selective context extraction to reduce token usage
-            # Extract only relevant report sections based on slide topics
-            selective_report_knowledge = self.build_selective_context_fn(presentation_outline, report_knowledge)
-            
-            # Serialize the selective context (compact format for agent messages)
-            selective_report_knowledge_str = self.serialization_service.serialize(
-                selective_report_knowledge,
-                pretty=False
-            )
-            
-            # Build simple message with data - let agent's instructions.md handle interpretation
-            # The agent already has all the logic for custom instructions, duration, etc. in its instructions.md
-            message_parts = [
-                f"[PRESENTATION_OUTLINE]\n{serialized_outline}\n[END_PRESENTATION_OUTLINE]",
-                f"[REPORT_KNOWLEDGE]\n{selective_report_knowledge_str}\n[END_REPORT_KNOWLEDGE]",
-            ]
-            
-            # Add simple data fields (not elaborate prompts - agent's instructions.md handles interpretation)
-            if self.config.custom_instruction and self.config.custom_instruction.strip():
-                message_parts.append(f"[CUSTOM_INSTRUCTION]\n{self.config.custom_instruction}\n[END_CUSTOM_INSTRUCTION]")
-            
-            message_parts.append(f"[DURATION]\n{self.config.duration}\n[END_DURATION]")
-            
-            if self.config.scenario:
-                message_parts.append(f"[SCENARIO]\n{self.config.scenario}\n[END_SCENARIO]")
-            
-            if self.config.target_audience:
-                message_parts.append(f"[TARGET_AUDIENCE]\n{self.config.target_audience}\n[END_TARGET_AUDIENCE]")
-            
             slide_and_script = await self.executor.run_agent(
                 self.agent_registry.get("slide_and_script_generator"),
-                "\n\n".join(message_parts),
+                self._build_message(presentation_outline, report_knowledge),
                 "slide_and_script",
                 parse_json=True
             )
@@ -136,30 +171,37 @@ class SlideGenerationHandler:
         except AgentExecutionError as e:
             slide_and_script = await self._handle_agent_execution_error(e, presentation_outline, report_knowledge)
         
-        # Validate and process the output
-        slide_and_script = self._validate_and_fix_output(slide_and_script)
+        # Validate and process the output; a rejected output must not be served from the response cache
+        try:
+            slide_and_script = self._validate_and_fix_output(slide_and_script)
         
-        slide_deck = slide_and_script.get("slide_deck")
-        presentation_script = slide_and_script.get("presentation_script")
+            slide_deck = slide_and_script.get("slide_deck")
+            presentation_script = slide_and_script.get("presentation_script")
         
-        if not slide_deck:
-            logger.error(f"❌ slide_and_script missing 'slide_deck' field")
-            logger.error(f"   Available keys: {list(slide_and_script.keys())}")
-            raise AgentOutputError(
-                f"slide_and_script missing 'slide_deck' field",
-                agent_name="SlideAndScriptGeneratorAgent",
-                output_key="slide_deck",
-                available_keys=list(slide_and_script.keys())
-            )
-        if not presentation_script:
-            logger.error(f"❌ slide_and_script missing 'presentation_script' field")
-            logger.error(f"   Available keys: {list(slide_and_script.keys())}")
-            raise AgentOutputError(
-                f"slide_and_script missing 'presentation_script' field",
-                agent_name="SlideAndScriptGeneratorAgent",
-                output_key="presentation_script",
-                available_keys=list(slide_and_script.keys())
+            if not slide_deck:
+                logger.error(f"❌ slide_and_script missing 'slide_deck' field")
+                logger.error(f"   Available keys: {list(slide_and_script.keys())}")
+                raise AgentOutputError(
+                    f"slide_and_script missing 'slide_deck' field",
+                    agent_name="SlideAndScriptGeneratorAgent",
+                    output_key="slide_deck",
+                    available_keys=list(slide_and_script.keys())
+                )
+            if not presentation_script:
+                logger.error(f"❌ slide_and_script missing 'presentation_script' field")
+                logger.error(f"   Available keys: {list(slide_and_script.keys())}")
+                raise AgentOutputError(
+                    f"slide_and_script missing 'presentation_script' field",
+                    agent_name="SlideAndScriptGeneratorAgent",
+                    output_key="presentation_script",
+                    available_keys=list(slide_and_script.keys())
+                )
+        except AgentOutputError:
+            self.executor.discard_cached_response(
+                self.agent_registry.get("slide_and_script_generator"),
+                self._build_message(presentation_outline, report_knowledge)
             )
+            raise
         
         # Recalculate estimated_time based on word count (estimated_seconds = total_words / 2)
         presentation_script = self._recalculate_speech_timing(presentation_script)
@@ -169,8 +211,10 @@ class SlideGenerationHandler:
         self.outputs["presentation_script"] = presentation_script
         
         if self.save_intermediate:
-            save_json_output(slide_deck, str(self.output_dir / SLIDE_DECK_FILE))
-            save_json_output(presentation_script, str(self.output_dir / PRESENTATION_SCRIPT_FILE))
+            await save_json_outputs_async([
+                (slide_deck, str(self.output_dir / SLIDE_DECK_FILE)),
+                (presentation_script, str(self.output_dir / PRESENTATION_SCRIPT_FILE)),
+            ])
             print(f"✅ Slide deck and script saved")
         
         self.obs_logger.finish_agent_execution(AgentStatus.SUCCESS, has_output=True)
@@ -191,25 +235,15 @@ class SlideGenerationHandler:
         raw_output = getattr(e, 'raw_output', '')
         
         # Check if it's a syntax error or plain text response (should retry)
-        is_syntax_error = any(indicator in error_msg.lower() for indicator in [
-            "expecting property name",
-            "expecting ',' delimiter",
-            "expecting ':' delimiter",
-            "invalid escape",
-            "expecting value",  # Often means no JSON at all
-            "failed to parse json",  # Generic parsing failure
-        ])
+        # (generic "failed to parse json" failures are included, so unclear cases are retried)
+        error_msg_lower = error_msg.lower()
+        is_syntax_error = any(indicator in error_msg_lower for indicator in _JSON_SYNTAX_ERROR_INDICATORS)
         
         # Also check if the raw output looks like plain text (question/explanation) instead of JSON
         if raw_output and not raw_output.strip().startswith('{'):
             is_syntax_error = True
             logger.warning(f"Agent returned plain text instead of JSON (likely asked a question). Will retry LLM call.")
         
-        # If we can't determine, default to retrying (safer approach)
-        if not is_syntax_error and "failed to parse json" in error_msg.lower():
-            is_syntax_error = True
-            logger.warning(f"Generic JSON parsing failure detected. Will retry LLM call.")
-        
         if is_syntax_error:
             logger.warning(f"JSONParseError indicates syntax error (malformed JSON from LLM). Retrying LLM call (up to {LLM_RETRY_COUNT} times): {e}")
             
@@ -217,16 +251,9 @@ class SlideGenerationHandler:
             for retry_attempt in range(1, LLM_RETRY_COUNT + 1):
                 try:
                     logger.info(f"Retry attempt {retry_attempt}/{LLM_RETRY_COUNT} for JSON syntax error")
-                    serialized_outline = self.serialization_manager.get_serialized_presentation_outline(pretty=False)
-                    selective_report_knowledge = self.build_selective_context_fn(presentation_outline, report_knowledge)
-                    selective_report_knowledge_str = self.serialization_service.serialize(
-                        selective_report_knowledge,
-                        pretty=False
-                    )
-                    
                     slide_and_script = await self.executor.run_agent(
                         self.agent_registry.get("slide_and_script_generator"),
-                        f"Generate slides and script based on:\nOutline: {serialized_outline}\nReport Knowledge: {selective_report_knowledge_str}",
+                        self._build_message(presentation_outline, report_knowledge),
                         "slide_and_script",
                         parse_json=True
                     )
@@ -259,16 +286,9 @@ class SlideGenerationHandler:
             for retry_attempt in range(1, LLM_RETRY_COUNT + 1):
                 try:
                     logger.info(f"Retry attempt {retry_attempt}/{LLM_RETRY_COUNT} for missing output")
-                    serialized_outline = self.serialization_manager.get_serialized_presentation_outline(pretty=False)
-                    selective_report_knowledge = self.build_selective_context_fn(presentation_outline, report_knowledge)
-                    selective_report_knowledge_str = self.serialization_service.serialize(
-                        selective_report_knowledge,
-                        pretty=False
-                    )
-                    
                     slide_and_script = await self.executor.run_agent(
                         self.agent_registry.get("slide_and_script_generator"),
-                        f"Generate slides and script based on:\nOutline: {serialized_outline}\nReport Knowledge: {selective_report_knowledge_str}",
+                        self._build_message(presentation_outline, report_knowledge),
                         "slide_and_script",
                         parse_json=True
                     )
@@ -293,16 +313,9 @@ class SlideGenerationHandler:
     ) -> Dict:
         """Try fallback parsing strategies for JSON errors."""
         try:
-            serialized_outline = self.serialization_manager.get_serialized_presentation_outline(pretty=False)
-            selective_report_knowledge = self.build_selective_context_fn(presentation_outline, report_knowledge)
-            selective_report_knowledge_str = self.serialization_service.serialize(
-                selective_report_knowledge,
-                pretty=False
-            )
-            
             slide_and_script = await self.executor.run_agent(
                 self.agent_registry.get("slide_and_script_generator"),
-                f"Generate slides and script based on:\nOutline: {serialized_outline}\nReport Knowledge: {selective_report_knowledge_str}",
+                self._build_message(presentation_outline, report_knowledge),
                 "slide_and_script",
                 parse_json=False  # Get raw string output
             )
@@ -331,14 +344,7 @@ class SlideGenerationHandler:
                         logger.error(f"Failed to parse JSON from markdown block: {e}")
                         # Try direct JSON parsing as last resort
                         try:
-                            cleaned = slide_and_script.strip()
-                            if cleaned.startswith("```json"):
-                                cleaned = cleaned[7:].lstrip()
-                            elif cleaned.startswith("```"):
-                                cleaned = cleaned[3:].lstrip()
-                            if cleaned.endswith("```"):
-                                cleaned = cleaned[:-3].rstrip()
-                            return json.loads(cleaned)
+                            return parse_json_maybe_fenced(slide_and_script)
                         except json.JSONDecodeError as e2:
                             logger.error(f"Failed to parse slide_and_script: {e2}")
                             logger.error(f"First 1000 chars: {slide_and_script[:1000]}")
@@ -351,19 +357,13 @@ class SlideGenerationHandler:
                 else:
                     # Try direct JSON parsing as last resort
                     try:
-                        cleaned = slide_and_script.strip()
-                        if cleaned.startswith("```json"):
-                            cleaned = cleaned[7:].lstrip()
-                        elif cleaned.startswith("```"):
-                            cleaned = cleaned[3:].lstrip()
-                        if cleaned.endswith("```"):
-                            cleaned = cleaned[:-3].rstrip()
-                        return json.loads(cleaned)
+                        return parse_json_maybe_fenced(slide_and_script)
                     except json.JSONDecodeError as e:
                         logger.error(f"Failed to parse slide_and_script: {e}")
                         logger.error(f"First 1000 chars: {slide_and_script[:1000]}")
                         # Check if it looks like an error message
-                        if "unable" in slide_and_script.lower() or "error" in slide_and_script.lower() or "cannot" in slide_and_script.lower():
+                        slide_and_script_lower = slide_and_script.lower()
+                        if any(marker in slide_and_script_lower for marker in _PLAIN_TEXT_ERROR_MARKERS):
                             raise JSONParseError(
                                 f"Agent returned a plain text error message instead of JSON. "
                                 f"This usually means the agent encountered an issue (e.g., missing data) but failed to return JSON. "
@@ -395,7 +395,8 @@ class SlideGenerationHandler:
         
         # Log what we got for debugging
         logger.info(f"✅ slide_and_script parsed successfully. Keys: {list(slide_and_script.keys())}")
-        logger.info(f"   Full structure preview: {json.dumps(slide_and_script, indent=2)[:2000]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"   Full structure preview: {preview_json(slide_and_script)}")
         
         # CRITICAL VALIDATION: Check if agent returned a single slide object instead of the required structure
         single_slide_keys = {'slide_number', 'title', 'content', 'visual_elements', 'design_spec', 'formatting_notes', 'speaker_notes'}
@@ -3,13 +3,16 @@ Web slides generation handler
 Handles the web slides (HTML) generation step of the pipeline.
 """
 
+import asyncio
 import json
 import logging
+import re
+import traceback
 from typing import Dict, Any, Optional
 from pathlib import Path
 
-from config import PresentationConfig, WEB_SLIDES_RESULT_FILE
-from presentation_agent.utils.helpers import save_json_output
+from config import PresentationConfig, WEB_SLIDES_RESULT_FILE, LLM_RETRY_COUNT
+from presentation_agent.utils.helpers import save_json_outputs_async
 from presentation_agent.utils.observability import AgentStatus
 from presentation_agent.core.exceptions import AgentExecutionError, AgentOutputError
 from presentation_agent.tools.web_slides_generator import generate_web_slides_tool
@@ -17,6 +20,9 @@ from presentation_agent.tools.web_slides_generator.utils import _parse_json_safe
 
 logger = logging.getLogger(__name__)
 
+# Keywords in an exception message that suggest a transient, retryable failure (one scan)
+_RETRYABLE_ERROR_RE = re.compile(r'get|attribute|type|parse|json|str|dict', re.IGNORECASE)
+
 
 class WebSlidesGenerationHandler:
     """
@@ -82,47 +88,13 @@ class WebSlidesGenerationHandler:
         slide_deck = self.session.state.get("slide_deck") or self.outputs.get("slide_deck")
         presentation_script = self.outputs.get("presentation_script")
         
-        # Parse JSON strings if needed (handle cases where data is stored as string or escaped JSON)
-        if isinstance(slide_deck, str):
-            try:
-                slide_deck = _parse_json_safely(slide_deck)
-                logger.info("✅ Parsed slide_deck from JSON string (with unescaping)")
-            except ValueError as e:
-                logger.error(f"❌ Failed to parse slide_deck JSON string: {e}")
-                self.obs_logger.finish_agent_execution(AgentStatus.FAILED, str(e), has_output=False)
-                raise AgentOutputError(
-                    f"slide_deck is a string but not valid JSON: {e}",
-                    agent_name="WebSlidesGenerator"
-                )
-        
-        if isinstance(presentation_script, str):
-            try:
-                presentation_script = _parse_json_safely(presentation_script)
-                logger.info("✅ Parsed presentation_script from JSON string (with unescaping)")
-            except ValueError as e:
-                logger.error(f"❌ Failed to parse presentation_script JSON string: {e}")
-                self.obs_logger.finish_agent_execution(AgentStatus.FAILED, str(e), has_output=False)
-                raise AgentOutputError(
-                    f"presentation_script is a string but not valid JSON: {e}",
-                    agent_name="WebSlidesGenerator"
-                )
-        
-        # Ensure they are dicts
-        if not isinstance(slide_deck, dict):
-            logger.error(f"❌ slide_deck is not a dict, got {type(slide_deck).__name__}")
-            self.obs_logger.finish_agent_execution(AgentStatus.FAILED, f"slide_deck is {type(slide_deck).__name__}, expected dict", has_output=False)
-            raise AgentOutputError(
-                f"slide_deck must be a dict, got {type(slide_deck).__name__}",
-                agent_name="WebSlidesGenerator"
-            )
-        
-        if not isinstance(presentation_script, dict):
-            logger.error(f"❌ presentation_script is not a dict, got {type(presentation_script).__name__}")
-            self.obs_logger.finish_agent_execution(AgentStatus.FAILED, f"presentation_script is {type(presentation_script).__name__}, expected dict", has_output=False)
-            raise AgentOutputError(
-                f"presentation_script must be a dict, got {type(presentation_script).__name__}",
-                agent_name="WebSlidesGenerator"
-            )
+        # Parse JSON strings if needed and ensure both inputs are dicts
+        try:
+            slide_deck = _coerce_dict(slide_deck, "slide_deck")
+            presentation_script = _coerce_dict(presentation_script, "presentation_script")
+        except AgentOutputError as e:
+            self.obs_logger.finish_agent_execution(AgentStatus.FAILED, str(e), has_output=False)
+            raise
         
         if not slide_deck or not presentation_script:
             self.obs_logger.finish_agent_execution(AgentStatus.FAILED, "Missing slide_deck or presentation_script", has_output=False)
@@ -146,7 +118,6 @@ class WebSlidesGenerationHandler:
             presentation_title = 'Generated Presentation'
         
         # Retry logic for web slides generation (use config value)
-        from config import LLM_RETRY_COUNT
         MAX_RETRIES = LLM_RETRY_COUNT
         last_error = None
         
@@ -158,7 +129,9 @@ class WebSlidesGenerationHandler:
                 else:
                     print("   🚀 Generating web slides HTML...")
                 
-                web_result = generate_web_slides_tool(
+                # Rendering (and any image fetching) is blocking, so keep it off the event loop
+                web_result = await asyncio.to_thread(
+                    generate_web_slides_tool,
                     slide_deck=slide_deck,
                     presentation_script=presentation_script,
                     config=config_dict,
@@ -201,8 +174,8 @@ class WebSlidesGenerationHandler:
                             agent_name="WebSlidesGenerator"
                         )
                 
-                # Safely check status
-                status = web_result.get('status') if isinstance(web_result, dict) else None
+                # web_result is a dict from here on (non-dict results retried or raised above)
+                status = web_result.get('status')
                 if status == 'success':
                     self.outputs["web_slides_result"] = web_result
                     self.session.state["web_slides_result"] = web_result
@@ -222,13 +195,13 @@ class WebSlidesGenerationHandler:
                             print(f"   ⚠️  Could not open browser: {e}")
                     
                     if self.save_intermediate:
-                        save_json_output(web_result, str(self.output_dir / WEB_SLIDES_RESULT_FILE))
+                        await save_json_outputs_async([(web_result, str(self.output_dir / WEB_SLIDES_RESULT_FILE))])
                     
                     self.obs_logger.finish_agent_execution(AgentStatus.SUCCESS, has_output=True)
                     return {"web_slides_result": web_result}
                 else:
                     # Status is not 'success', check if we should retry
-                    error_msg = web_result.get('error', 'Unknown error') if isinstance(web_result, dict) else str(web_result)
+                    error_msg = web_result.get('error', 'Unknown error')
                     if attempt < MAX_RETRIES:
                         last_error = error_msg
                         logger.warning(f"⚠️  Attempt {attempt + 1} failed with status '{status}': {error_msg}. Retrying...")
@@ -243,7 +216,6 @@ class WebSlidesGenerationHandler:
             except (AttributeError, TypeError) as e:
                 # Handle errors like 'str' object has no attribute 'get'
                 error_msg = str(e)
-                import traceback
                 error_trace = traceback.format_exc()
                 logger.error(f"❌ Attempt {attempt + 1} failed with type error: {error_msg}")
                 logger.error(f"   Full traceback:\n{error_trace}")
@@ -261,14 +233,11 @@ class WebSlidesGenerationHandler:
             except Exception as e:
                 # Other exceptions - retry if it's a transient error
                 error_msg = str(e)
-                import traceback
                 error_trace = traceback.format_exc()
                 logger.error(f"❌ Attempt {attempt + 1} failed with exception: {type(e).__name__}: {error_msg}")
                 logger.error(f"   Full traceback:\n{error_trace}")
                 # Only retry for certain types of errors (transient issues)
-                is_retryable = any(keyword in error_msg.lower() for keyword in [
-                    'get', 'attribute', 'type', 'parse', 'json', 'str', 'dict'
-                ])
+                is_retryable = _RETRYABLE_ERROR_RE.search(error_msg) is not None
                 
                 if is_retryable and attempt < MAX_RETRIES:
                     last_error = error_msg
@@ -291,3 +260,37 @@ class WebSlidesGenerationHandler:
             agent_name="WebSlidesGenerator"
         )
 
+
+def _coerce_dict(value: Any, name: str) -> Dict[str, Any]:
+    """
+    Coerce a pipeline output to a dict, parsing (possibly escaped) JSON strings.
+    
+    Args:
+        value: Output value (dict or JSON string)
+        name: Output name, used in log and error messages
+    
+    Returns:
+        The value as a dict
+    
+    Raises:
+        AgentOutputError: If the value is not a dict or a valid JSON object string
+    """
+    if isinstance(value, str):
+        try:
+            value = _parse_json_safely(value)
+            logger.info(f"✅ Parsed {name} from JSON string (with unescaping)")
+        except ValueError as e:
+            logger.error(f"❌ Failed to parse {name} JSON string: {e}")
+            raise AgentOutputError(
+                f"{name} is a string but not valid JSON: {e}",
+                agent_name="WebSlidesGenerator"
+            )
+    
+    if not isinstance(value, dict):
+        logger.error(f"❌ {name} is not a dict, got {type(value).__name__}")
+        raise AgentOutputError(
+            f"{name} must be a dict, got {type(value).__name__}",
+            agent_name="WebSlidesGenerator"
+        )
+    
+    return value
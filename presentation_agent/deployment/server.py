@@ -8,6 +8,7 @@ import sys
 import json
 import asyncio
 import logging
+import concurrent.futures
 from pathlib import Path
 
 # Configure logging
@@ -134,6 +135,52 @@ def health_check():
     return jsonify({"status": "healthy"}), 200
 
 
+async def _run_pipeline_for_request(config: "PresentationConfig"):
+    """
+    Run the presentation pipeline for a single /generate request.
+    
+    Args:
+        config: PresentationConfig built from the request payload
+        
+    Returns:
+        Pipeline outputs dictionary
+    """
+    logger = logging.getLogger(__name__)
+    logger.info("🚀 Starting presentation pipeline execution...")
+    
+    # Use /tmp/output for Cloud Run (ephemeral writable storage)
+    outputs = await run_presentation_pipeline(
+        config=config,
+        output_dir=OUTPUT_DIR_DEPLOYMENT,
+        include_critics=True,
+        save_intermediate=True,
+        open_browser=False  # Disable browser opening in Cloud Run
+    )
+    
+    logger.info(f"✅ Pipeline execution completed. Outputs: {list(outputs.keys())}")
+    return outputs
+
+
+def _run_pipeline_in_thread(config: "PresentationConfig"):
+    """
+    Run the async pipeline in a new event loop owned by the calling thread.
+    
+    Running in a separate thread avoids event loop conflicts with the server.
+    
+    Args:
+        config: PresentationConfig built from the request payload
+        
+    Returns:
+        Pipeline outputs dictionary
+    """
+    new_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(new_loop)
+    try:
+        return new_loop.run_until_complete(_run_pipeline_for_request(config))
+    finally:
+        new_loop.close()
+
+
 @app.route('/generate', methods=['POST'])
 def generate_presentation():
     """
@@ -182,43 +229,9 @@ def generate_presentation():
             style_images=data.get("style_images", [])
         )
         
-        # Run the agent pipeline
-        async def run_agent():
-            logger = logging.getLogger(__name__)
-            logger.info("🚀 Starting presentation pipeline execution...")
-            
-            # Use /tmp/output for Cloud Run (ephemeral writable storage)
-            output_dir = OUTPUT_DIR_DEPLOYMENT
-            
-            outputs = await run_presentation_pipeline(
-                config=config,
-                output_dir=output_dir,
-                include_critics=True,
-                save_intermediate=True,
-                open_browser=False  # Disable browser opening in Cloud Run
-            )
-            
-            logger.info(f"✅ Pipeline execution completed. Outputs: {list(outputs.keys())}")
-            return outputs
-        
-        # Run async function in a separate thread to avoid event loop conflicts
-        # This ensures the async function runs in its own isolated event loop
-        import concurrent.futures
-        import threading
-        
-        def run_in_thread():
-            """Run the async function in a new event loop in this thread"""
-            # Create a new event loop for this thread
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                return new_loop.run_until_complete(run_agent())
-            finally:
-                new_loop.close()
-        
-        # Execute in a thread pool to isolate the event loop
+        # Run the pipeline in a worker thread with its own event loop
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(run_in_thread)
+            future = executor.submit(_run_pipeline_in_thread, config)
             outputs = future.result()
         
         # Get logger for response handling
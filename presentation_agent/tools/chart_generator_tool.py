@@ -3,7 +3,8 @@ ADK Tool for generating charts using Plotly.
 This tool is used by SlideAndScriptGeneratorAgent to generate chart images.
 """
 
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,27 @@ except ImportError:
     CHART_GENERATOR_AVAILABLE = False
     logger.warning("⚠️  Chart generator not available. Install plotly and kaleido.")
 
+# Read-only shared template; callers always receive a fresh dict built from it
+_ERROR_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    "status": "error",
+    "chart_data": None,
+})
+
+
+def _error_response(error_msg: str, chart_type: str, title: str) -> Dict[str, Any]:
+    """
+    Build an error result for generate_chart_tool.
+    
+    Args:
+        error_msg: Error message
+        chart_type: Requested chart type
+        title: Requested chart title
+    
+    Returns:
+        Error result dictionary
+    """
+    return {**_ERROR_TEMPLATE, "error": error_msg, "chart_type": chart_type, "title": title}
+
 
 def generate_chart_tool(
     chart_type: str,
@@ -90,12 +112,11 @@ def generate_chart_tool(
         )
     """
     if not CHART_GENERATOR_AVAILABLE:
-        return {
-            "status": "error",
-            "error": "Chart generator not available. Install plotly and kaleido: pip install plotly kaleido",
-            "chart_type": chart_type,
-            "title": title
-        }
+        return _error_response(
+            "Chart generator not available. Install plotly and kaleido: pip install plotly kaleido",
+            chart_type,
+            title,
+        )
     
     try:
         # Build chart specification
@@ -134,20 +155,10 @@ def generate_chart_tool(
                 "error": None
             }
         else:
-            return {
-                "status": "error",
-                "error": "Chart generation returned empty data",
-                "chart_type": chart_type,
-                "title": title
-            }
+            return _error_response("Chart generation returned empty data", chart_type, title)
     
     except Exception as e:
         error_msg = str(e)
         logger.error(f"❌ Failed to generate chart: {error_msg}")
-        return {
-            "status": "error",
-            "error": error_msg,
-            "chart_type": chart_type,
-            "title": title
-        }
+        return _error_response(error_msg, chart_type, title)
 
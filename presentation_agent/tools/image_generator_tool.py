@@ -8,6 +8,7 @@ Generates images in a consistent bubble-style with pastel colors.
 import os
 import base64
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pathlib import Path
 import requests
@@ -183,6 +184,30 @@ def _resize_image_if_needed(image_bytes: bytes, max_width: int, max_height: int)
         return image_bytes
 
 
+@lru_cache(maxsize=32)
+def _ensure_dir(directory: Path) -> None:
+    """Create an output directory once per process instead of before every image write."""
+    directory.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=4)
+def _get_genai_client(api_key: str) -> "genai.Client":
+    """
+    Get a shared Gemini client for an API key.
+    
+    Images are generated concurrently from a thread pool; one client per key
+    lets all of them reuse its HTTP connection pool instead of paying client
+    setup and TLS handshakes per image. The client is thread-safe.
+    
+    Args:
+        api_key: Google API key
+        
+    Returns:
+        Shared genai.Client instance
+    """
+    return genai.Client(api_key=api_key)
+
+
 def generate_image_with_gemini(keyword: str, output_dir: Optional[Path] = None, is_logo: bool = False) -> Optional[str]:
     """
     Generate an image using Gemini 2.5 Flash Image (Nano Banana).
@@ -241,8 +266,8 @@ def generate_image_with_gemini(keyword: str, output_dir: Optional[Path] = None,
             max_height=max_height
         )
         
-        # Initialize Gemini client
-        client = genai.Client(api_key=api_key)
+        # Reuse the pooled Gemini client (shared HTTP connections across images)
+        client = _get_genai_client(api_key)
         
         logger.info(f"Generating image for keyword: {keyword} using {GEMINI_IMAGE_MODEL}")
         
@@ -300,7 +325,7 @@ def generate_image_with_gemini(keyword: str, output_dir: Optional[Path] = None,
                                     
                                     # Save to file if output_dir provided (for caching/debugging)
                                     if output_dir:
-                                        output_dir.mkdir(parents=True, exist_ok=True)
+                                        _ensure_dir(output_dir)
                                         safe_keyword = "".join(c if c.isalnum() or c in "-_" else "_" for c in keyword)
                                         image_path = output_dir / f"{safe_keyword}.png"
                                         image_path.write_bytes(image_bytes)
@@ -325,7 +350,7 @@ def generate_image_with_gemini(keyword: str, output_dir: Optional[Path] = None,
                 
                 # Save to file if output_dir provided (for caching/debugging)
                 if output_dir:
-                    output_dir.mkdir(parents=True, exist_ok=True)
+                    _ensure_dir(output_dir)
                     safe_keyword = "".join(c if c.isalnum() or c in "-_" else "_" for c in keyword)
                     image_path = output_dir / f"{safe_keyword}.png"
                     image_path.write_bytes(image_bytes)
@@ -376,7 +401,7 @@ def generate_image_with_gemini(keyword: str, output_dir: Optional[Path] = None,
                                     
                                     # Save to file if output_dir provided (for caching/debugging)
                                     if output_dir:
-                                        output_dir.mkdir(parents=True, exist_ok=True)
+                                        _ensure_dir(output_dir)
                                         safe_keyword = "".join(c if c.isalnum() or c in "-_" else "_" for c in keyword)
                                         image_path = output_dir / f"{safe_keyword}.png"
                                         image_path.write_bytes(image_bytes)
@@ -510,7 +535,7 @@ def generate_image_with_stability_ai(keyword: str, output_dir: Optional[Path] =
             
             # Save to file if output_dir provided (for caching/debugging)
             if output_dir:
-                output_dir.mkdir(parents=True, exist_ok=True)
+                _ensure_dir(output_dir)
                 safe_keyword = "".join(c if c.isalnum() or c in "-_" else "_" for c in keyword)
                 image_path = output_dir / f"{safe_keyword}.png"
                 image_path.write_bytes(image_data)
@@ -1,32 +1,41 @@
 """
 Utilities package for presentation generation pipeline.
+
+Exports are resolved lazily (PEP 562) so importing one utility module, e.g.
+presentation_agent.utils.instruction_loader, does not also pull in the PDF
+and image stacks.
 """
 
-from .pdf_loader import load_pdf_from_url, load_pdf_from_file, load_pdf
-from .helpers import (
-    extract_output_from_events,
-    save_json_output,
-    preview_json,
-    build_initial_message,
-)
-from .image_helper import (
-    get_image_url,
-    generate_images_parallel,
-    clear_image_cache,
-    clear_image_cache_async,
-)
-
-__all__ = [
-    "load_pdf_from_url",
-    "load_pdf_from_file",
-    "load_pdf",
-    "extract_output_from_events",
-    "save_json_output",
-    "preview_json",
-    "build_initial_message",
-    "get_image_url",
-    "generate_images_parallel",
-    "clear_image_cache",
-    "clear_image_cache_async",
-]
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "load_pdf_from_url": ".pdf_loader",
+    "load_pdf_from_file": ".pdf_loader",
+    "load_pdf": ".pdf_loader",
+    "extract_output_from_events": ".helpers",
+    "save_json_output": ".helpers",
+    "save_json_outputs_async": ".helpers",
+    "preview_json": ".helpers",
+    "build_initial_message": ".helpers",
+    "get_image_url": ".image_helper",
+    "generate_images_parallel": ".image_helper",
+    "clear_image_cache": ".image_helper",
+    "clear_image_cache_async": ".image_helper",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import an exported name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,8 +2,25 @@
 Helper functions for the presentation generation pipeline.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, Optional
+import logging
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from presentation_agent.core.json_parser import (
+    extract_json_from_text,
+    parse_json_robust,
+    strip_markdown_fences,
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 
 def is_valid_chart_data(chart_data: Any, min_length: int = 100) -> bool:
@@ -43,6 +60,11 @@ def clean_chart_data(chart_data: str) -> str:
     return chart_data
 
 
+def _event_agent_name(event: Any) -> str:
+    """Best-effort name of the agent that produced an event (for logging)."""
+    return getattr(event, 'agent_name', None) or (getattr(event, 'agent', None) and getattr(event.agent, 'name', None)) or 'Unknown'
+
+
 def extract_output_from_events(events: list, output_key: str) -> Optional[Any]:
     """
     Extract output from events, checking multiple locations:
@@ -51,15 +73,12 @@ def extract_output_from_events(events: list, output_key: str) -> Optional[Any]:
     3. actions.tool_results (tool results)
     
     Args:
-        events: List of events from runner.run_debug()
+        events: List of events from runner.run_async()
         output_key: Key to extract from state_delta
         
     Returns:
         Extracted value (dict if JSON, otherwise raw value)
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
     if not events:
         logger.warning(f"⚠️ extract_output_from_events: No events provided for key '{output_key}'")
         return None
@@ -68,37 +87,40 @@ def extract_output_from_events(events: list, output_key: str) -> Optional[Any]:
     
     # Priority 1: Check state_delta in all events (not just last)
     raw = None
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     
     for i, event in enumerate(reversed(events)):  # Check from last to first
-        agent_name = getattr(event, 'agent_name', None) or (getattr(event, 'agent', None) and getattr(event.agent, 'name', None)) or 'Unknown'
-        if hasattr(event, 'actions') and event.actions:
-            if hasattr(event.actions, 'state_delta') and event.actions.state_delta:
-                delta_keys = list(event.actions.state_delta.keys())
-                logger.debug(f"   Event {len(events)-1-i} ({agent_name}): state_delta keys: {delta_keys}")
-                if output_key in delta_keys:
-                    raw = event.actions.state_delta.get(output_key, None)
-                    logger.info(f"✅ Found '{output_key}' in state_delta of Event {len(events)-1-i} ({agent_name})")
-                    # Log the raw value type and structure for slide_and_script
-                    if output_key == "slide_and_script" and raw is not None:
-                        logger.info(f"   Raw value type: {type(raw).__name__}")
-                        if isinstance(raw, dict):
-                            logger.info(f"   Raw value keys: {list(raw.keys())}")
-                            # Check structure immediately
-                            if "slide_deck" not in raw and "presentation_script" not in raw:
-                                single_slide_keys = {'slide_number', 'title', 'content', 'visual_elements', 'design_spec'}
-                                if single_slide_keys.issubset(set(raw.keys())):
-                                    logger.error(f"   ❌ RAW VALUE IS A SINGLE SLIDE OBJECT! Keys: {list(raw.keys())}")
-                        elif isinstance(raw, str):
-                            logger.info(f"   Raw value length: {len(raw)}")
-                            logger.info(f"   Contains 'slide_deck': {'slide_deck' in raw}")
-                            logger.info(f"   Contains 'presentation_script': {'presentation_script' in raw}")
-                    break
+        actions = getattr(event, 'actions', None)
+        state_delta = getattr(actions, 'state_delta', None) if actions else None
+        if not state_delta:
+            continue
+        if debug_enabled:
+            logger.debug(f"   Event {len(events)-1-i} ({_event_agent_name(event)}): state_delta keys: {list(state_delta.keys())}")
+        # Direct dict membership test; no per-event key list is built
+        if output_key in state_delta:
+            raw = state_delta[output_key]
+            logger.info(f"✅ Found '{output_key}' in state_delta of Event {len(events)-1-i} ({_event_agent_name(event)})")
+            # Log the raw value type and structure for slide_and_script
+            if output_key == "slide_and_script" and raw is not None:
+                logger.info(f"   Raw value type: {type(raw).__name__}")
+                if isinstance(raw, dict):
+                    logger.info(f"   Raw value keys: {list(raw.keys())}")
+                    # Check structure immediately
+                    if "slide_deck" not in raw and "presentation_script" not in raw:
+                        single_slide_keys = {'slide_number', 'title', 'content', 'visual_elements', 'design_spec'}
+                        if single_slide_keys.issubset(raw.keys()):
+                            logger.error(f"   ❌ RAW VALUE IS A SINGLE SLIDE OBJECT! Keys: {list(raw.keys())}")
+                elif isinstance(raw, str):
+                    logger.info(f"   Raw value length: {len(raw)}")
+                    logger.info(f"   Contains 'slide_deck': {'slide_deck' in raw}")
+                    logger.info(f"   Contains 'presentation_script': {'presentation_script' in raw}")
+            break
     
     # Priority 2: Check content.parts[].text (agent text output)
     if raw is None:
         logger.debug(f"   Checking content.parts[].text for agent output...")
         for i, event in enumerate(reversed(events)):  # Check from last to first
-            agent_name = getattr(event, 'agent_name', None) or (getattr(event, 'agent', None) and getattr(event.agent, 'name', None)) or 'Unknown'
+            agent_name = _event_agent_name(event)
             if hasattr(event, 'content') and event.content:
                 if hasattr(event.content, 'parts') and event.content.parts:
                     try:
@@ -144,7 +166,7 @@ def extract_output_from_events(events: list, output_key: str) -> Optional[Any]:
     if raw is None:
         logger.debug(f"   Checking tool_results for '{output_key}'...")
         for i, event in enumerate(reversed(events)):  # Check from last to first
-            agent_name = getattr(event, 'agent_name', None) or (getattr(event, 'agent', None) and getattr(event.agent, 'name', None)) or 'Unknown'
+            agent_name = _event_agent_name(event)
             if hasattr(event, 'actions') and event.actions:
                 if hasattr(event.actions, 'tool_results') and event.actions.tool_results:
                     logger.debug(f"   Event {len(events)-1-i} ({agent_name}): Found {len(event.actions.tool_results)} tool_results")
@@ -180,7 +202,7 @@ def extract_output_from_events(events: list, output_key: str) -> Optional[Any]:
         # Log all agent names and state_delta keys for debugging
         agent_names = []
         for i, event in enumerate(events):
-            agent_name = getattr(event, 'agent_name', None) or (getattr(event, 'agent', None) and getattr(event.agent, 'name', None)) or 'Unknown'
+            agent_name = _event_agent_name(event)
             agent_names.append(agent_name)
             # Log state_delta keys for each event
             if hasattr(event, 'actions') and event.actions:
@@ -200,17 +222,7 @@ def extract_output_from_events(events: list, output_key: str) -> Optional[Any]:
         logger.debug(f"Raw output is a string (length: {len(raw)}). Attempting to parse...")
         
         # Strip markdown code blocks if present (```json ... ```)
-        cleaned = raw.strip()
-        if cleaned.startswith("```json"):
-            # Remove opening ```json
-            cleaned = cleaned[7:].lstrip()
-        elif cleaned.startswith("```"):
-            # Remove opening ```
-            cleaned = cleaned[3:].lstrip()
-        
-        if cleaned.endswith("```"):
-            # Remove closing ```
-            cleaned = cleaned[:-3].rstrip()
+        cleaned = strip_markdown_fences(raw)
         
         # Try to parse as JSON directly first
         try:
@@ -220,7 +232,6 @@ def extract_output_from_events(events: list, output_key: str) -> Optional[Any]:
         except json.JSONDecodeError:
             logger.debug("Direct JSON parse failed, trying robust extraction...")
             # If that fails, use robust JSON extraction (finds largest/outermost object)
-            from presentation_agent.core.json_parser import extract_json_from_text, parse_json_robust
             extracted_json = extract_json_from_text(cleaned)
             if extracted_json:
                 try:
@@ -262,15 +273,46 @@ def save_json_output(data: Any, filename: str, indent: int = 2) -> None:
         filename: Output filename
         indent: JSON indentation level
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    serialized = None
+    if ORJSON_AVAILABLE and indent == 2:
+        # orjson only supports 2-space indentation; it writes NaN/Infinity as null
+        # and 1e+20 as 1e20, and raises on integers beyond 64 bits (json is used then)
+        try:
+            serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            serialized = None
+    if serialized is not None:
+        with open(filename, "wb") as f:
+            f.write(serialized)
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
     print(f"✅ JSON saved to `{filename}`")
 
 
+async def save_json_outputs_async(pending: Iterable[Tuple[Any, str]]) -> None:
+    """
+    Save several JSON files concurrently without blocking the event loop.
+    
+    Each write runs in a worker thread, so the batch costs roughly the
+    slowest write instead of the sum of all writes.
+    
+    Args:
+        pending: (data, filename) pairs to save with save_json_output
+    """
+    await asyncio.gather(*(
+        asyncio.to_thread(save_json_output, data, filename)
+        for data, filename in pending
+    ))
+
+
 def preview_json(data: Any, max_chars: int = 2000) -> str:
     """
     Generate a preview of JSON data.
     
+    Encodes lazily and stops once max_chars are produced, so previewing a
+    large document (e.g. report_knowledge) costs O(max_chars), not O(size).
+    
     Args:
         data: Data to preview
         max_chars: Maximum characters to show
@@ -278,11 +320,15 @@ def preview_json(data: Any, max_chars: int = 2000) -> str:
     Returns:
         Preview string
     """
-    pretty = json.dumps(data, indent=2, ensure_ascii=False)
-    preview = pretty[:max_chars]
-    if len(pretty) > max_chars:
-        preview += "\n... (truncated)"
-    return preview
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    chunks = []
+    length = 0
+    for chunk in encoder.iterencode(data):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > max_chars:
+            return "".join(chunks)[:max_chars] + "\n... (truncated)"
+    return "".join(chunks)
 
 
 def build_initial_message(config: Dict[str, Any], report_content: str) -> str:
@@ -11,6 +11,7 @@ Supports:
 """
 
 import logging
+import traceback
 import base64
 import hashlib
 import json
@@ -234,7 +235,6 @@ def get_image_url(keyword: str, source: str = "generative", is_logo: bool = Fals
                 raise RuntimeError(f"Image generation returned None for keyword '{keyword}'")
         except Exception as e:
             logger.error(f"❌ Image generation failed for keyword '{keyword}': {e}")
-            import traceback
             logger.error(f"   Full traceback: {traceback.format_exc()}")
             # DO NOT fallback to placeholder - re-raise the error
             raise
@@ -255,7 +255,6 @@ def _get_placeholder_url(keyword: str, is_logo: bool = False) -> str:
     Returns:
         Placeholder image URL (using picsum.photos for reliable placeholder service)
     """
-    import hashlib
     # Use picsum.photos for reliable placeholder images
     # Use keyword hash as seed for consistent images per keyword
     keyword_hash = hashlib.md5(keyword.encode()).hexdigest()[:8]
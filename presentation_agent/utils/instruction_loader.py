@@ -1,13 +1,18 @@
 """
 Helper function to load agent instructions from markdown files.
 """
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def load_instruction(agent_dir: Path, filename: str = "instructions.md") -> str:
     """
     Load agent instruction from a markdown file.
     
+    Instructions are static text, so each file is read once per process and
+    the same string object is returned on later calls.
+    
     Args:
         agent_dir: Path to the agent directory (e.g., Path(__file__).parent)
         filename: Name of the instruction file (default: "instructions.md")
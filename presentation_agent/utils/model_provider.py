@@ -0,0 +1,29 @@
+"""
+Shared Gemini model instances for all agents.
+"""
+from functools import lru_cache
+
+from google.adk.models.google_llm import Gemini
+
+from config import get_retry_config
+
+
+@lru_cache(maxsize=None)
+def get_shared_model(model: str) -> Gemini:
+    """
+    Get the process-wide Gemini model wrapper for a model name.
+    
+    The wrapper is stateless per request (sessions live in the runner) and
+    lazily creates its genai client, so sharing one instance per model name
+    lets every agent reuse the same client, auth and HTTP connection pool.
+    
+    Args:
+        model: Gemini model name (e.g., DEFAULT_MODEL or CRITIC_MODEL)
+    
+    Returns:
+        Shared Gemini instance configured with the shared retry options
+    """
+    return Gemini(
+        model=model,
+        retry_options=get_retry_config(),
+    )
@@ -12,6 +12,16 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+# zstandard is optional: only needed when trace compression is enabled
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+ZSTD_SUFFIX = ".zst"
+
 
 class AgentStatus(Enum):
     """Status of an agent execution."""
@@ -107,16 +117,18 @@ class PipelineMetrics:
 class ObservabilityLogger:
     """Main observability logger for tracking agent executions and metrics."""
     
-    def __init__(self, log_file: str = "observability.log", trace_file: Optional[str] = None):
+    def __init__(self, log_file: str = "observability.log", trace_file: Optional[str] = None, compress_trace: bool = False):
         """
         Initialize observability logger.
         
         Args:
             log_file: Path to structured log file
             trace_file: Path to trace history JSON file (optional)
+            compress_trace: If True (and zstandard is installed), save the trace as <trace_file>.zst
         """
         self.log_file = log_file
         self.trace_file = trace_file
+        self.compress_trace = compress_trace and ZSTD_AVAILABLE
         self.metrics: Optional[PipelineMetrics] = None
         self.current_execution: Optional[AgentExecution] = None
         
@@ -318,12 +330,17 @@ class ObservabilityLogger:
         trace_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Save to file
-        with open(trace_path, 'w') as f:
-            json.dump(trace_data, f, indent=2, default=str)
+        if self.compress_trace:
+            trace_path = trace_path.with_name(trace_path.name + ZSTD_SUFFIX)
+            payload = json.dumps(trace_data, separators=(',', ':'), default=str).encode('utf-8')
+            trace_path.write_bytes(zstandard.ZstdCompressor(level=3).compress(payload))
+        else:
+            with open(trace_path, 'w') as f:
+                json.dump(trace_data, f, indent=2, default=str)
         
         self.logger.info(
-            f"Trace history saved to {self.trace_file}",
-            extra={'data': json.dumps({'trace_file': self.trace_file})}
+            f"Trace history saved to {trace_path}",
+            extra={'data': json.dumps({'trace_file': str(trace_path)})}
         )
     
     def print_metrics_summary(self):
@@ -365,7 +382,7 @@ class ObservabilityLogger:
         print("=" * 60)
         print(f"📝 Structured logs: {self.log_file}")
         if self.trace_file:
-            print(f"📊 Trace history: {self.trace_file}")
+            print(f"📊 Trace history: {self.trace_file}{ZSTD_SUFFIX if self.compress_trace else ''}")
         print("=" * 60 + "\n")
 
 
@@ -375,7 +392,8 @@ _observability_logger: Optional[ObservabilityLogger] = None
 
 def get_observability_logger(
     log_file: str = "observability.log",
-    trace_file: Optional[str] = None
+    trace_file: Optional[str] = None,
+    compress_trace: bool = False
 ) -> ObservabilityLogger:
     """
     Get or create the global observability logger instance.
@@ -383,16 +401,36 @@ def get_observability_logger(
     Args:
         log_file: Path to structured log file
         trace_file: Path to trace history JSON file
+        compress_trace: Save the trace history zstd-compressed
         
     Returns:
         ObservabilityLogger instance
     """
     global _observability_logger
     if _observability_logger is None:
-        _observability_logger = ObservabilityLogger(log_file=log_file, trace_file=trace_file)
+        _observability_logger = ObservabilityLogger(log_file=log_file, trace_file=trace_file, compress_trace=compress_trace)
     return _observability_logger
 
 
+def load_trace_history(trace_file: str) -> Dict:
+    """
+    Load a saved trace history, plain JSON or zstd-compressed (.zst).
+    
+    Args:
+        trace_file: Path to the trace history file
+        
+    Returns:
+        Trace history dictionary
+    """
+    trace_path = Path(trace_file)
+    if trace_path.suffix == ZSTD_SUFFIX:
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is required to read compressed trace history: pip install zstandard")
+        return json.loads(zstandard.ZstdDecompressor().decompress(trace_path.read_bytes()))
+    with open(trace_path, 'r') as f:
+        return json.load(f)
+
+
 def reset_observability_logger():
     """Reset the global observability logger (useful for testing)."""
     global _observability_logger
@@ -2,10 +2,62 @@
 Utility functions for loading PDF content from URLs or local files.
 """
 
+import hashlib
+import logging
+import os
+import time
 from pypdf import PdfReader
 import requests
 from io import BytesIO
 from pathlib import Path
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+# pypdfium2 (native PDFium) is optional: it extracts text far faster than pure-Python pypdf
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    pdfium = None
+    PDFIUM_AVAILABLE = False
+
+
+def _extract_text(source: Union[bytes, str]) -> str:
+    """
+    Extract text from all pages of a PDF.
+    
+    Uses pypdfium2 when installed and falls back to pypdf otherwise.
+    
+    Args:
+        source: PDF file contents (bytes) or path to a local PDF file
+        
+    Returns:
+        Extracted text content from all pages
+    """
+    if PDFIUM_AVAILABLE:
+        try:
+            pdf = pdfium.PdfDocument(source)
+            try:
+                page_texts = []
+                for page in pdf:
+                    try:
+                        textpage = page.get_textpage()
+                        try:
+                            page_texts.append(textpage.get_text_range())
+                        finally:
+                            textpage.close()
+                    finally:
+                        page.close()
+                # PDFium uses \r\n line breaks; normalize to \n like the pypdf path
+                return "\n".join(page_texts).replace("\r\n", "\n").replace("\r", "\n")
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.warning(f"⚠️  pypdfium2 text extraction failed, falling back to pypdf: {e}")
+    
+    reader = PdfReader(BytesIO(source) if isinstance(source, bytes) else source)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
 
 
 def load_pdf_from_url(url: str) -> str:
@@ -20,9 +72,7 @@ def load_pdf_from_url(url: str) -> str:
     """
     response = requests.get(url)
     response.raise_for_status()
-    reader = PdfReader(BytesIO(response.content))
-    text = "\n".join(page.extract_text() or "" for page in reader.pages)
-    return text
+    return _extract_text(response.content)
 
 
 def load_pdf_from_file(file_path: str) -> str:
@@ -39,9 +89,7 @@ def load_pdf_from_file(file_path: str) -> str:
     if not path.exists():
         raise FileNotFoundError(f"PDF file not found: {file_path}")
     
-    reader = PdfReader(str(path))
-    text = "\n".join(page.extract_text() or "" for page in reader.pages)
-    return text
+    return _extract_text(str(path))
 
 
 def load_pdf(report_url: str = None, report_file: str = None) -> str:
@@ -65,3 +113,41 @@ def load_pdf(report_url: str = None, report_file: str = None) -> str:
     else:
         raise ValueError("Either report_url or report_file must be provided")
 
+
+
+def load_pdf_from_url_cached(url: str, cache_dir: str, ttl_seconds: int) -> str:
+    """
+    Load PDF text from a URL, reusing a parsed copy cached on disk.
+    
+    The cache entry is keyed by a SHA-256 of the URL and is reused while it is
+    younger than ttl_seconds; otherwise the PDF is downloaded and parsed again.
+    
+    Args:
+        url: URL to the PDF file
+        cache_dir: Directory holding cached text files
+        ttl_seconds: Maximum age of a cache entry in seconds
+        
+    Returns:
+        Extracted text content from all pages
+    """
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    cache_path = Path(cache_dir) / f"{key}.txt"
+    
+    try:
+        if time.time() - cache_path.stat().st_mtime < ttl_seconds:
+            logger.info(f"♻️  Loaded PDF text from cache: {cache_path.name}")
+            return cache_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
+    
+    text = load_pdf_from_url(url)
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"⚠️  Could not write PDF cache entry {cache_path.name}: {e}")
+    
+    return text